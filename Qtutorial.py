@@ -7,27 +7,43 @@ from __future__ import annotations
 
 import sys
 import math
+import bisect
+import contextlib
+import functools
+from collections import Counter
+from fractions import Fraction
 from dataclasses import dataclass
-from typing import Dict, Tuple, Optional, List, Callable
+from types import MappingProxyType
+from typing import Dict, Tuple, Optional, List, Callable, Iterator, Set, TYPE_CHECKING
 
 from PyQt6.QtWidgets import (
     QAbstractScrollArea,
     QApplication,QProgressBar, QWidget, QHBoxLayout, QVBoxLayout,
     QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsItem,
-    QGraphicsTextItem, QLabel, QPushButton, QMessageBox,
-    QTabWidget, QDialog, QTextEdit, QInputDialog, QGraphicsDropShadowEffect,
+    QGraphicsTextItem, QGraphicsSimpleTextItem, QGraphicsPixmapItem, QGraphicsPathItem, QLabel, QPushButton, QMessageBox,
+    QTabWidget, QDialog, QTextEdit, QInputDialog, QGraphicsBlurEffect,
     QSplitter, QScrollArea, QSizePolicy,QListWidget,QStackedWidget, QRadioButton, QGroupBox, QGridLayout, QCheckBox      # tutorial용 import
 )
-from PyQt6.QtGui import QColor, QPen, QPainter, QFont, QBrush, QLinearGradient, QCursor, QDrag
-from PyQt6.QtCore import Qt, QRectF, QPointF, QMimeData, qInstallMessageHandler, QtMsgType
-
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+from PyQt6.QtGui import QColor, QPen, QPainter, QFont, QBrush, QLinearGradient, QCursor, QDrag, QPixmap, QImage, QTextDocument, QPainterPath, QFontMetricsF, QOpenGLContext
+from PyQt6.QtCore import Qt, QRectF, QPointF, QMimeData, qInstallMessageHandler, QtMsgType, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # OpenGL 모듈 없는 PyQt6 빌드면 기본(래스터) 뷰포트 사용
+    QOpenGLWidget = None
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import CircuitInstruction, Parameter
+from qiskit.circuit.library import (
+    HGate, XGate, YGate, ZGate, RXGate, RYGate, RZGate, CXGate, CZGate, MCXGate, Measure,
+)
+if TYPE_CHECKING:
+    from qiskit_aer import AerSimulator
 
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-from qiskit.visualization import plot_bloch_multivector
-from qiskit.quantum_info import Statevector, partial_trace, Operator
+from matplotlib.figure import Figure
+from qiskit.visualization import plot_bloch_vector
+from qiskit.quantum_info import Statevector, DensityMatrix
 import numpy as np
 
 # ============================================================
@@ -42,21 +58,293 @@ X_OFFSET = 80
 Y_OFFSET = 90
 MAX_COLS = 17
 
-
+TUTORIAL_CIRCUIT_HEIGHT = 500
+TRANSPILE_CACHE_SIZE = 64
+STATEVECTOR_CACHE_SIZE = 8
+BLOCH_DEBOUNCE_MS = 50
+
+# export_qiskit에서 사용하는 단일 큐비트 게이트별 코드 템플릿
+_QISKIT_FMT = {
+    "H": "qc.h({r})\n",
+    "X": "qc.x({r})\n",
+    "Y": "qc.y({r})\n",
+    "Z": "qc.z({r})\n",
+    "RX": "qc.rx({a}, {r})\n",
+    "RY": "qc.ry({a}, {r})\n",
+    "RZ": "qc.rz({a}, {r})\n",
+    "MEASURE": "qc.measure({r}, {r})\n",
+}
+
+# build_qiskit_circuit에서 사용하는 게이트 객체 (파라미터 없는 게이트는 싱글톤)
+_SINGLE_GATES = {"H": HGate(), "X": XGate(), "Y": YGate(), "Z": ZGate()}
+_ROTATION_GATES = {"RX": RXGate, "RY": RYGate, "RZ": RZGate}
+_CX_GATE = CXGate()
+_CZ_GATE = CZGate()
+_MEASURE = Measure()
+
+
+# 제어 개수별 다중 제어 게이트는 한 번 만들어 재사용 (ZGate().control은 호출마다 정의를 새로 만듦)
+@functools.lru_cache(maxsize=None)
+def _mcx_gate(num_ctrls: int) -> MCXGate:
+    return MCXGate(num_ctrls)
+
+
+@functools.lru_cache(maxsize=None)
+def _mcz_gate(num_ctrls: int):
+    return ZGate().control(num_ctrls)
+
+# 게이트 종류 묶음 (GateItem.gate_type은 intern되어 있어 해시/비교가 포인터 비교로 끝남)
+_ROTATION_TYPES = frozenset(_ROTATION_GATES)          # 각도를 갖는 회전 게이트
+_TARGET_TYPES = frozenset(("X_T", "Z_T"))              # 제어 게이트의 타겟
+_CONNECTOR_TYPES = frozenset(("CTRL", "X_T", "Z_T"))   # 세로 연결선으로 잇는 노드
+
+
+def _qiskit_code_line(op, rows: List[int]) -> str:
+    """build_qiskit_circuit이 만든 명령 하나를 export용 Qiskit 코드 한 줄로 변환"""
+    name = op.name
+    fmt = _QISKIT_FMT.get(name.upper())
+    if fmt is not None:
+        return fmt.format(r=rows[0], a=op.params[0] if op.params else 0)
+    # 제어 게이트: 타겟은 마지막 큐비트, 제어가 둘 이상이면 mcx/mcz
+    *ctrls, t = rows
+    base = op.base_gate.name
+    if len(ctrls) == 1:
+        return f"qc.c{base}({ctrls[0]}, {t})\n"
+    return f"qc.mc{base}({ctrls}, {t})\n"
+
+
+def _new_simulator(**options) -> AerSimulator:
+    """qiskit_aer는 무거우므로 처음 시뮬레이션할 때 import"""
+    from qiskit_aer import AerSimulator
+    return AerSimulator(**options)
+
+# 튜토리얼 회로 구성용: 게이트 종류 -> QuantumCircuit에 추가하는 함수
+# (회전 게이트의 angle이 None이면 0으로 처리)
+_QC_DISPATCH: Dict[str, Callable] = {
+    "H": lambda qc, g: qc.h(g.row),
+    "X": lambda qc, g: qc.x(g.row),
+    "Y": lambda qc, g: qc.y(g.row),
+    "Z": lambda qc, g: qc.z(g.row),
+    "RX": lambda qc, g: qc.rx(g.angle if g.angle is not None else 0, g.row),
+    "RY": lambda qc, g: qc.ry(g.angle if g.angle is not None else 0, g.row),
+    "RZ": lambda qc, g: qc.rz(g.angle if g.angle is not None else 0, g.row),
+}
+
+
+def _apply_column(qc, ops, measure=False):
+    """한 열(ops)의 게이트를 qc에 추가하고 측정한 행 목록을 반환
+
+    measure=True면 M 게이트도 그 자리에서 qc.measure로 추가함.
+    """
+    ctrls, xt, zt, measured = [], [], [], []
+    for g in ops:
+        t = g.gate_type
+        fn = _QC_DISPATCH.get(t)
+        if fn is not None:
+            fn(qc, g)
+        elif t == "CTRL":
+            ctrls.append(g.row)
+        elif t == "X_T":
+            xt.append(g.row)
+        elif t == "Z_T":
+            zt.append(g.row)
+        elif t == "MEASURE" and measure:
+            measured.append(g.row)
+            qc.measure(g.row, g.row)
+
+    if len(xt)==1:
+        t = xt[0]
+        if len(ctrls)==0: qc.x(t)
+        elif len(ctrls)==1: qc.cx(ctrls[0], t)
+        else: qc.mcx(ctrls, t)
+
+    if len(zt)==1:
+        t = zt[0]
+        if len(ctrls)==0: qc.z(t)
+        elif len(ctrls)==1: qc.cz(ctrls[0], t)
+        else: qc.append(_mcz_gate(len(ctrls)), ctrls + [t])   # MCZ
+
+    return measured
+
+
+def _pi_label(num: int, den: int) -> str:
+    if num == 0:
+        return "0"
+    if den == 1:
+        return "π" if num == 1 else f"{num}π"
+    return f"{'' if num == 1 else num}π/{den}"
+
+
+# 분모 8 이하, |계수| <= 2 인 기약분수 표 (정렬된 계수 / 표시 문자열)
+_PI_FRACS = sorted({Fraction(n, d) for d in range(1, 9) for n in range(-2 * d, 2 * d + 1)})
+_PI_FRAC_COEFS = [float(f) for f in _PI_FRACS]
+_PI_FRAC_LABELS = [_pi_label(f.numerator, f.denominator) for f in _PI_FRACS]
+
+
+def _reduced_1q(psi: np.ndarray, target: int, n: int) -> np.ndarray:
+    """n-큐비트 상태 벡터 psi에서 target 큐비트의 2x2 축약 밀도 행렬 (나머지는 trace out)
+
+    Qiskit은 little-endian이므로 인덱스 i의 target 비트는 (i >> target) & 1.
+    psi를 (상위 비트, target 비트, 하위 비트) 3축으로 보면 복사 없는 view가 되고,
+    ρ_ab = Σ psi[h, a, l] · conj(psi[h, b, l]).
+    ρ는 에르미트이므로 대각 두 개와 ρ_01만 계산하고 ρ_10 = conj(ρ_01)로 채움.
+    """
+    p = psi.reshape(1 << (n - 1 - target), 2, 1 << target)
+    p0, p1 = p[:, 0, :], p[:, 1, :]
+    r00 = np.vdot(p0, p0).real
+    r11 = np.vdot(p1, p1).real
+    r01 = np.vdot(p1, p0)
+    return np.array([[r00, r01], [r01.conjugate(), r11]])
+
+
+# Bloch 표시용 상태 벡터 진화에 쓰는 2x2 행렬 (Qiskit 게이트와 같은 정의)
+# 화면 표시/샘플링에는 단정밀도로 충분하므로 complex64로 계산 (메모리 대역폭 절반)
+_STATE_DTYPE = np.complex64
+_SQRT1_2 = 1 / math.sqrt(2)
+_FIXED_1Q = {
+    "H": np.array([[_SQRT1_2, _SQRT1_2], [_SQRT1_2, -_SQRT1_2]], dtype=_STATE_DTYPE),
+    "X": np.array([[0, 1], [1, 0]], dtype=_STATE_DTYPE),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=_STATE_DTYPE),
+    "Z": np.array([[1, 0], [0, -1]], dtype=_STATE_DTYPE),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _rotation_1q(gate_type: str, angle: float) -> np.ndarray:
+    """회전 게이트 행렬 - 같은 (종류, 각도)는 재사용하므로 읽기 전용으로 반환"""
+    c, s = math.cos(angle / 2), math.sin(angle / 2)
+    if gate_type == "RX":
+        U = np.array([[c, -1j * s], [-1j * s, c]], dtype=_STATE_DTYPE)
+    elif gate_type == "RY":
+        U = np.array([[c, -s], [s, c]], dtype=_STATE_DTYPE)
+    else:   # RZ
+        U = np.array([[c - 1j * s, 0], [0, c + 1j * s]], dtype=_STATE_DTYPE)
+    U.setflags(write=False)
+    return U
+
+
+def _apply_1q(psi: np.ndarray, U: np.ndarray, target: int, n: int) -> np.ndarray:
+    """psi에 2x2 행렬 U를 target 큐비트에 적용한 새 상태 벡터 (_reduced_1q와 같은 3축 view)"""
+    p = psi.reshape(1 << (n - 1 - target), 2, 1 << target)
+    return np.einsum("ab,hbl->hal", U, p).reshape(-1)
+
+
+def _apply_column_np(psi: np.ndarray, ops, n: int) -> np.ndarray:
+    """_apply_column과 같은 규칙으로 한 열의 게이트를 psi에 직접 적용 (측정은 무시)"""
+    ctrls, xt, zt = [], [], []
+    for g in ops:
+        t = g.gate_type
+        U = _FIXED_1Q.get(t)
+        if U is None and t in _ROTATION_TYPES:
+            U = _rotation_1q(t, g.angle if g.angle is not None else 0)
+        if U is not None:
+            psi = _apply_1q(psi, U, g.row, n)
+        elif t == "CTRL":
+            ctrls.append(g.row)
+        elif t == "X_T":
+            xt.append(g.row)
+        elif t == "Z_T":
+            zt.append(g.row)
+
+    if len(xt) != 1 and len(zt) != 1:
+        return psi
+
+    # 제어 큐비트가 모두 1인 부분만 골라 X(타겟 축 뒤집기) / Z(타겟 1에 -1) 적용
+    # [2]*n 모양에서 큐비트 q는 축 n-1-q (little-endian)
+    psi = psi.reshape((2,) * n).copy()
+    sel = [slice(None)] * n
+    for c in ctrls:
+        sel[n - 1 - c] = slice(1, 2)
+    if len(xt) == 1:
+        sub = psi[tuple(sel)]
+        sub[...] = np.flip(sub, axis=n - 1 - xt[0]).copy()
+    if len(zt) == 1:
+        zsel = list(sel)
+        zsel[n - 1 - zt[0]] = slice(1, 2)
+        psi[tuple(zsel)] *= -1
+    return psi.reshape(-1)
+
+
+def _evolve_columns(prefix, columns, n: int):
+    """columns [(열 키, ops)]를 |0…0⟩에 적용한 상태 벡터와 새 접두 상태 목록을 반환
+
+    prefix [(열 키, 그 열까지 적용한 상태)]에서 앞쪽의 같은 열은 다시 계산하지 않음.
+    인자를 수정하지 않으므로 작업 스레드에서 호출해도 됨.
+    """
+    # 1. 이전 계산과 같은 열이 이어지는 곳까지는 저장된 상태 사용
+    psi = np.zeros(1 << n, dtype=_STATE_DTYPE)
+    psi[0] = 1
+    same = 0
+    for (key, _), (old_key, old_psi) in zip(columns, prefix):
+        if key != old_key:
+            break
+        psi = old_psi
+        same += 1
+    prefix = prefix[:same]
+
+    # 2. 처음 바뀐 열부터 한 열씩 NumPy로 직접 진화 (QuantumCircuit/Operator 생성 없음)
+    for key, ops in columns[same:]:
+        psi = _apply_column_np(psi, ops, n)
+        prefix.append((key, psi))
+    return prefix, psi
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_pi_fraction(angle: float) -> str:
+    """각도(rad)를 'π/2' 같은 표시 문자열로 변환"""
+    coef = angle / math.pi
+    if _PI_FRAC_COEFS[0] <= coef <= _PI_FRAC_COEFS[-1]:
+        # 표에서 양옆 두 분수만 비교 (분수 간격 >= 1/56 이므로 1e-3 안에는 최대 하나)
+        i = bisect.bisect_left(_PI_FRAC_COEFS, coef)
+        for j in (i - 1, i):
+            if 0 <= j < len(_PI_FRAC_COEFS) and abs(_PI_FRAC_COEFS[j] - coef) < 1e-3:
+                return _PI_FRAC_LABELS[j]
+    else:
+        # 표 범위 밖 (대화상자 범위 0~2π 밖) 은 분모 8 이하에서 가장 가까운 분수
+        frac = Fraction(coef).limit_denominator(8)
+        if abs(frac.numerator / frac.denominator - coef) < 1e-3:
+            return _pi_label(frac.numerator, frac.denominator)
+    return f"{coef:.2f}π"
 
 # ============================================================
 # DATA CLASS
 # ============================================================
-@dataclass
+# iter_by_column이 회로가 바뀔 때마다 게이트 수만큼 만들므로 __slots__로 가볍게 유지
+@dataclass(slots=True)
 class GateInfo:
     gate_type: str
     row: int
     col: int
     angle: Optional[float] = None
 
+# ------------------------------------------------------------
+# CircuitView 설정 (Composer / Tutorial 공용)
+# ------------------------------------------------------------
+@dataclass(frozen=True)
+class CircuitViewCfg:
+    wire_shift: int = -30
+    # None이면 큐비트 수에 맞춰 scene 높이를 계산, 값이 있으면 고정 높이 사용
+    scene_height: Optional[int] = None
+
 # ------------------------------------------------------------
 # TutorialStep Model
 # ------------------------------------------------------------
+def _has_gates(*required: Tuple[str, Optional[int]]) -> Callable[[list], bool]:
+    """(gate_type, row) 쌍이 모두 배치되어 있는지 검사하는 TutorialStep.expected 함수
+
+    row가 None이면 행과 상관없이 그 종류의 게이트가 하나라도 있으면 됨.
+    조건마다 infos를 다시 훑지 않고 (종류, 행) 집합을 한 번 만들어 포함 관계로 판정.
+    """
+    required = frozenset(required)
+
+    def expected(infos) -> bool:
+        present = {(g.gate_type, g.row) for g in infos}
+        present.update([(t, None) for t, _ in present])
+        return required <= present
+
+    return expected
+
+
 @dataclass
 class TutorialStep:
     title: str
@@ -74,6 +362,10 @@ class Tutorial:
     theory_key: str
     steps: List["TutorialStep"]
 
+    def __post_init__(self):
+        # TUTORIAL_DATA의 키와 같은 객체가 되도록 intern
+        self.theory_key = sys.intern(self.theory_key)
+
 
 # ============================================
 # [신규 추가] Bloch Sphere Visualization Canvas
@@ -95,30 +387,38 @@ class BlochCanvas(QWidget):
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.layout_box.addWidget(self.status_label)
         
-        self.current_canvas = None
+        # Figure/캔버스는 한 번만 만들고 update_bloch에서는 다시 그리기만 함
+        self._fig = Figure(figsize=(5, 5))
+        self._layout_done = False
+        self.current_canvas = FigureCanvasQTAgg(self._fig)
+        self.current_canvas.setMinimumSize(450, 450)
+        self.current_canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.layout_box.addWidget(self.current_canvas)
         # 화면 잘림 방지를 위한 최소 높이 설정
         self.setMinimumHeight(550) 
         self.hide() 
 
-    def update_bloch(self, density_matrix, qubit_index):
-        if self.current_canvas is not None:
-            self.layout_box.removeWidget(self.current_canvas)
-            self.current_canvas.setParent(None)
-            self.current_canvas = None
-
+    def update_bloch(self, state, qubit_index):
+        """state: 1-큐비트 Statevector(순수 상태) 또는 축약된 DensityMatrix"""
         # --- [핵심] 얽힘 상태 강제 보정 로직 ---
         # 1. 현재 상태의 벡터 길이 계산
-        X = Operator.from_label('X')
-        Y = Operator.from_label('Y')
-        Z = Operator.from_label('Z')
-        
-        vx = np.real(density_matrix.expectation_value(X))
-        vy = np.real(density_matrix.expectation_value(Y))
-        vz = np.real(density_matrix.expectation_value(Z))
+        if isinstance(state, Statevector):
+            # 순수 상태는 진폭에서 바로 구함 (c = ψ0* ψ1)
+            psi = state.data
+            c = psi[0].conjugate() * psi[1]
+            vx, vy = 2 * c.real, 2 * c.imag
+            vz = abs(psi[0]) ** 2 - abs(psi[1]) ** 2
+        else:
+            # 1-큐비트 밀도 행렬에서 Bloch 벡터는 원소로 바로 구함
+            # (vx = 2Re ρ01, vy = 2Im ρ10, vz = ρ00 - ρ11)
+            rho = state.data
+            vx = 2 * rho[0, 1].real
+            vy = 2 * rho[1, 0].imag
+            vz = (rho[0, 0] - rho[1, 1]).real
         
         vector_length = np.sqrt(vx**2 + vy**2 + vz**2)
         
-        final_rho = density_matrix
+        bloch = [vx, vy, vz]
         is_forced = False
         
         # 2. 벡터 길이가 1보다 작으면(얽힘 상태) 강제로 늘림
@@ -131,20 +431,20 @@ class BlochCanvas(QWidget):
                 # 방향은 유지하되 길이만 1로 정규화
                 nx, ny, nz = vx / vector_length, vy / vector_length, vz / vector_length
             
-            # 정규화된 벡터로 밀도 행렬 재구성
-            I = Operator.from_label('I')
-            final_rho = 0.5 * (I + nx * X + ny * Y + nz * Z)
+            # 정규화된 벡터 = 순수 상태 0.5 * (I + nx X + ny Y + nz Z)의 Bloch 벡터
+            bloch = [nx, ny, nz]
         # --------------------------------
 
-        # 3. 그래프 그리기
-        new_fig = plot_bloch_multivector(final_rho) 
-        new_fig.set_size_inches(5, 5)
-        new_fig.tight_layout(pad=3.0)
-        plt.close(new_fig)
-
-        self.current_canvas = FigureCanvasQTAgg(new_fig)
-        self.current_canvas.setMinimumSize(450, 450)
-        self.current_canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        # 3. 기존 Figure에 그래프 다시 그리기 (축약된 1-큐비트 상태이므로 "qubit 0")
+        self._fig.clf()
+        ax = self._fig.add_subplot(1, 1, 1, projection="3d")
+        plot_bloch_vector(bloch, "qubit 0", ax=ax)
+        # 축 하나짜리 같은 그림이므로 여백은 처음 한 번만 계산하고 이후 subplot은 그 값을 그대로 씀
+        # (캔버스가 한 번 그려진 뒤 tight_layout을 다시 하면 Arrow3D의 2D 경로가 없어 예외가 남)
+        if not self._layout_done:
+            self._fig.tight_layout(pad=3.0)
+            self._layout_done = True
+        self.current_canvas.draw_idle()
         
         self.title_label.setText(f"Bloch Sphere: Qubit {qubit_index}")
         
@@ -155,7 +455,6 @@ class BlochCanvas(QWidget):
             self.status_label.setText("Pure State (Length = 1.0)")
             self.status_label.setStyleSheet("color: green;")
 
-        self.layout_box.addWidget(self.current_canvas)
         self.show()
 
 
@@ -165,22 +464,35 @@ class BlochCanvas(QWidget):
 class BlochButtonItem(QGraphicsRectItem):
     WIDTH = 45
     HEIGHT = 25
+    _BRUSH = QBrush(QColor("#FF9933"))
+    _PEN = QPen(Qt.GlobalColor.black)
+    # 라벨 글꼴과 가운데 정렬 위치는 모든 버튼이 같으므로 첫 버튼에서 한 번만 계산
+    _FONT: Optional[QFont] = None
+    _TEXT_POS: Optional[QPointF] = None
+
     def __init__(self, qubit_index, callback, x, y):
         super().__init__(0, 0, self.WIDTH, self.HEIGHT)
         self.qubit_index = qubit_index
         self.callback = callback
         self.setPos(x, y)
-        self.setBrush(QBrush(QColor("#FF9933"))) 
-        self.setPen(QPen(Qt.GlobalColor.black))
+        self.setBrush(self._BRUSH)
+        self.setPen(self._PEN)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setAcceptHoverEvents(True)
 
+        cls = BlochButtonItem
+        if cls._FONT is None:
+            cls._FONT = QFont("Segoe UI", 8, QFont.Weight.Bold)
         self.text = QGraphicsTextItem("Bloch", self)
-        font = QFont("Segoe UI", 8, QFont.Weight.Bold)
-        self.text.setFont(font)
-        r = self.rect()
-        b = self.text.boundingRect()
-        self.text.setPos((r.width() - b.width()) / 2, (r.height() - b.height()) / 2)
+        self.text.setFont(cls._FONT)
+        if cls._TEXT_POS is None:
+            b = self.text.boundingRect()
+            cls._TEXT_POS = QPointF((self.WIDTH - b.width()) / 2, (self.HEIGHT - b.height()) / 2)
+        self.text.setPos(cls._TEXT_POS)
+
+        # 버튼과 라벨은 바뀌지 않으므로 픽스맵 캐시를 그대로 재사용
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.text.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
     def mousePressEvent(self, event):
         if self.callback: self.callback(self.qubit_index)
@@ -194,18 +506,97 @@ class GateItem(QGraphicsRectItem):
     WIDTH = 46
     HEIGHT = 34
     RADIUS = 8
+
+    # 모든 게이트가 공유하는 브러시/펜/글꼴/외곽 경로 (첫 게이트 생성 시 한 번 만듦)
+    @staticmethod
+    def _gradient_brush(top, bottom):
+        grad = QLinearGradient(0, 0, 0, GateItem.HEIGHT)
+        grad.setColorAt(0, QColor(top))
+        grad.setColorAt(1, QColor(bottom))
+        return QBrush(grad)
+
+    _BRUSH_NORMAL = None
+    _BRUSH_HOVER = None
+    _PEN_OUTLINE = QPen(Qt.GlobalColor.black, 2)
+    _BRUSH_TEXT = QBrush(Qt.GlobalColor.black)
+    _ROUNDED_PATH = None
+    _PIXMAP_NORMAL = None
+    _PIXMAP_HOVER = None
+    _HALO_PIXMAP = None
+    # hover 그림자: 흐림 반경 18px, 사방 여백 HALO_MARGIN
+    HALO_MARGIN = 20
+    # 게이트 종류별 글꼴: CTRL, X_T, Z_T는 기호를 크게(16pt) 표시
+    _FONTS: Dict[str, QFont] = {}
+    _BIG_FONT_TYPES = _CONNECTOR_TYPES
+
+    @classmethod
+    def _init_paint_resources(cls):
+        cls._BRUSH_NORMAL = cls._gradient_brush("#93D5F5", "#6FBDE5")
+        cls._BRUSH_HOVER = cls._gradient_brush("#C7ECFF", "#9EDBFF")
+        cls._FONTS = {
+            "default": QFont("Segoe UI", 10, QFont.Weight.Bold),
+            "big": QFont("Segoe UI", 16, QFont.Weight.Bold),
+        }
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, cls.WIDTH, cls.HEIGHT), cls.RADIUS, cls.RADIUS)
+        cls._ROUNDED_PATH = path
+        cls._PIXMAP_NORMAL = cls._render_body(cls._BRUSH_NORMAL)
+        cls._PIXMAP_HOVER = cls._render_body(cls._BRUSH_HOVER)
+        cls._HALO_PIXMAP = cls._render_halo(cls._PIXMAP_NORMAL)
+
+    @classmethod
+    def _render_body(cls, brush):
+        # 안티앨리어싱된 둥근 사각형을 한 번만 래스터화 (펜 두께 2 → 사방 1px 여유)
+        dpr = QApplication.primaryScreen().devicePixelRatio() if QApplication.primaryScreen() else 1.0
+        pm = QPixmap(round((cls.WIDTH + 2) * dpr), round((cls.HEIGHT + 2) * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.translate(1, 1)
+        p.setBrush(brush)
+        p.setPen(cls._PEN_OUTLINE)
+        p.drawPath(cls._ROUNDED_PATH)
+        p.end()
+        return pm
+
+    @classmethod
+    def _render_halo(cls, body):
+        # 게이트 모양을 한 번만 흐리게 렌더링해 둔 그림자 (hover 때 매 프레임 블러하지 않도록)
+        m = cls.HALO_MARGIN
+        dpr = body.devicePixelRatio()
+        size = body.deviceIndependentSize().toSize()
+        img = QImage(round((size.width() + 2 * m) * dpr), round((size.height() + 2 * m) * dpr),
+                     QImage.Format.Format_ARGB32_Premultiplied)
+        img.setDevicePixelRatio(dpr)
+        img.fill(Qt.GlobalColor.transparent)
+
+        scene = QGraphicsScene(0, 0, size.width() + 2 * m, size.height() + 2 * m)
+        item = scene.addPixmap(body)
+        item.setPos(m, m)
+        blur = QGraphicsBlurEffect()
+        blur.setBlurRadius(18)
+        item.setGraphicsEffect(blur)
+
+        p = QPainter(img)
+        scene.render(p, QRectF(0, 0, size.width() + 2 * m, size.height() + 2 * m), scene.sceneRect())
+        # 흐려진 알파만 남기고 그림자 색으로 채움
+        p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        p.fillRect(QRectF(0, 0, size.width() + 2 * m, size.height() + 2 * m), QColor(60, 60, 60, 130))
+        p.end()
+        return QPixmap.fromImage(img)
     
     def __init__(self, label, gate_type, view=None, palette_mode=False):
         super().__init__(0, 0, self.WIDTH, self.HEIGHT)
 
         self.label = label
-        self.gate_type = gate_type
+        self.gate_type = sys.intern(gate_type)
         self.palette_mode = palette_mode
         self.view = view
 
         self.row = None
         self.col = None
-        self.angle: Optional[float] = None
+        self._angle: Optional[float] = None
         self.drag_started = False
         self.clone = None
 
@@ -215,54 +606,83 @@ class GateItem(QGraphicsRectItem):
         if not palette_mode:
             self.setFlag(QGraphicsRectItem.GraphicsItemFlag.ItemIsSelectable)
 
-        font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        self.text = QGraphicsTextItem(self)
-        self.text.setFont(font)
-        self.text.setDefaultTextColor(Qt.GlobalColor.black)
-        # 수동으로 paint()에서 텍스트를 그리므로, 자식 텍스트는 숨김 처리하여 겹침 방지
-        self.text.setVisible(False)
-        self.text.setPos(0, 0)  # ★ 위치 초기화
-
-        self.hovering = False
+        # 그리기는 자식 아이템(외곽 경로 + 텍스트)에 맡김
+        # paint()를 오버라이드하지 않으므로 다시 그릴 때 파이썬 코드가 실행되지 않음
+        if GateItem._ROUNDED_PATH is None:
+            GateItem._init_paint_resources()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+        self._halo_item = self._make_child(QGraphicsPixmapItem(GateItem._HALO_PIXMAP, self))
+        self._halo_item.setOffset(-1 - self.HALO_MARGIN, -1 - self.HALO_MARGIN)
+        self._halo_item.setZValue(-1)
+        self._halo_item.setVisible(False)
+        self._body_item = self._make_child(QGraphicsPixmapItem(GateItem._PIXMAP_NORMAL, self))
+        self._body_item.setOffset(-1, -1)
+
+        # 줄마다 가운데 정렬하도록 라벨 줄 / 각도 줄을 따로 둠
+        font = GateItem._FONTS["big" if gate_type in self._BIG_FONT_TYPES else "default"]
+        self._label_item = self._make_child(QGraphicsSimpleTextItem(self))
+        self._angle_item = self._make_child(QGraphicsSimpleTextItem(self))
+        for t in (self._label_item, self._angle_item):
+            t.setFont(font)
+            t.setBrush(GateItem._BRUSH_TEXT)
+            # 글자 래스터화 결과를 픽스맵으로 보관 - setText() 때만 다시 그림
+            t.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+        # 마지막으로 텍스트를 만든 (label, angle) - 바뀌지 않았으면 update_text 생략
+        self._text_key = None
         self.update_text()
-        self._center()
-        self.shadow = None
-        
+
+    def shape(self):
+        # 충돌/클릭 판정은 미리 만든 둥근 사각형 경로를 그대로 사용 (매번 경로를 만들지 않음)
+        return GateItem._ROUNDED_PATH
+
+    @property
+    def angle(self) -> Optional[float]:
+        return self._angle
+
+    @angle.setter
+    def angle(self, value: Optional[float]):
+        self._angle = value
+        # 회로에 놓인 게이트의 각도가 바뀌면 내보내기 캐시 무효화
+        if self.row is not None and self.view is not None:
+            self.view._invalidate_export_cache()
+
+    @staticmethod
+    def _make_child(item):
+        # 자식은 그리기만 담당 - 마우스/hover 이벤트는 부모(GateItem)가 받음
+        item.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        item.setAcceptHoverEvents(False)
+        return item
 
     def format_pi_fraction(self, angle):
         if angle is None:
             return ""
-        coef = angle / math.pi
-        best_num, best_den, best_err = None, None, 999
-        for den in range(1, 9):
-            num = round(coef * den)
-            err = abs(num / den - coef)
-            if err < best_err:
-                best_err, best_num, best_den = err, num, den
-        if best_err < 1e-3:
-            if best_num == 0:
-                return "0"
-            if best_den == 1:
-                return "π" if best_num == 1 else f"{best_num}π"
-            return f"{'' if best_num == 1 else best_num}π/{best_den}"
-        return f"{coef:.2f}π"
+        # 대화상자 입력(소수 4자리 xπ)이라 같은 각도가 반복되므로 모듈 수준 캐시 사용
+        return _format_pi_fraction(angle)
 
     def update_text(self):
-        if self.gate_type not in ("RX","RY","RZ"):
-            self.text.setPlainText(self.label)
-        else:
-            if self.angle is None:
-                self.text.setPlainText(self.label)
-            else:
-                frac = self.format_pi_fraction(self.angle)
-                self.text.setPlainText(f"{self.label}\n{frac}")
-        self._center()
+        key = (self.label, self.angle)
+        if key == self._text_key:
+            return
+        self._text_key = key
 
-    def _center(self):
-        r = self.rect()
-        t = self.text.boundingRect()
-        self.text.setPos((r.width() - t.width())/2,
-                         (r.height() - t.height())/2)
+        self._label_item.setText(self.label)
+        if self.gate_type not in _ROTATION_TYPES or self.angle is None:
+            self._angle_item.setVisible(False)
+            lines = (self._label_item,)
+        else:
+            self._angle_item.setText(self.format_pi_fraction(self.angle))
+            self._angle_item.setVisible(True)
+            lines = (self._label_item, self._angle_item)
+
+        # 텍스트 블록을 게이트 가운데에 배치 - QPainter.drawText(AlignCenter)와 같은 위치가 되도록
+        # 줄마다 글자 advance 폭으로 가로 정렬, 마지막 줄은 글꼴 높이로 블록 높이 계산
+        fm = QFontMetricsF(self._label_item.font())
+        line_h = self._label_item.boundingRect().height()
+        y = (self.HEIGHT - ((len(lines) - 1) * line_h + fm.height())) / 2
+        for t in lines:
+            t.setPos((self.WIDTH - fm.horizontalAdvance(t.text())) / 2, y)
+            y += line_h
 
     def open_angle_dialog(self):
         cur = (self.angle / math.pi) if self.angle is not None else 0.5
@@ -277,7 +697,7 @@ class GateItem(QGraphicsRectItem):
 
     def mousePressEvent(self, e):
         if e.button() == Qt.MouseButton.RightButton:
-            if not self.palette_mode and self.gate_type in ("RX","RY","RZ"):
+            if not self.palette_mode and self.gate_type in _ROTATION_TYPES:
                 self.open_angle_dialog()
             return
         e.accept()
@@ -287,7 +707,7 @@ class GateItem(QGraphicsRectItem):
 
     def mouseDoubleClickEvent(self, e):
         # 더블클릭으로도 각도 편집 가능 (회로에 놓인 RX/RY/RZ만)
-        if not self.palette_mode and self.gate_type in ("RX","RY","RZ"):
+        if not self.palette_mode and self.gate_type in _ROTATION_TYPES:
             self.open_angle_dialog()
             e.accept()
             return
@@ -328,45 +748,24 @@ class GateItem(QGraphicsRectItem):
         e.accept()
 
     def hoverEnterEvent(self, e):
-        self.hovering = True
-        if self.shadow is None:
-            self.shadow = QGraphicsDropShadowEffect()
-            self.shadow.setOffset(0,0)
-            self.shadow.setBlurRadius(18)
-            self.shadow.setColor(QColor(60,60,60,130))
-        self.setGraphicsEffect(self.shadow)
+        self._body_item.setPixmap(GateItem._PIXMAP_HOVER)
+        # 미리 흐려 둔 그림자 픽스맵만 켜고 끔 (QGraphicsEffect는 매 프레임 블러)
+        self._halo_item.setVisible(True)
 
     def hoverLeaveEvent(self, e):
-        self.hovering = False
-        self.setGraphicsEffect(None)
-        self.shadow = None
+        self._body_item.setPixmap(GateItem._PIXMAP_NORMAL)
+        self._halo_item.setVisible(False)
 
-    def paint(self, p, opt, widget=None):
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        grad = QLinearGradient(0,0,0,self.HEIGHT)
-        grad.setColorAt(0, QColor("#C7ECFF") if self.hovering else QColor("#93D5F5"))
-        grad.setColorAt(1, QColor("#9EDBFF") if self.hovering else QColor("#6FBDE5"))
-        p.setBrush(QBrush(grad))
-        pen = QPen(Qt.GlobalColor.black)
-        pen.setWidth(2)
-        p.setPen(pen)
-        p.drawRoundedRect(self.rect(), self.RADIUS, self.RADIUS)
-        
-        # ★ 텍스트 그리기
-        if hasattr(self, 'text') and self.text is not None:
-            font = self.text.font()
-            # CTRL, X_T, Z_T 게이트는 폰트 크기를 크게
-            if self.gate_type in ("CTRL", "X_T", "Z_T"):
-                font.setPointSize(16)  # 기본 10pt에서 16pt로 확대
-            p.setFont(font)
-            p.setPen(QPen(Qt.GlobalColor.black))
-            text_str = self.text.toPlainText()
-            rect = self.rect()
-            p.drawText(rect, int(Qt.AlignmentFlag.AlignCenter), text_str)
 
 class OracleGateItem(QGraphicsRectItem):
     
     WIDTH = 40
+
+    # paint()마다 새로 만들지 않도록 클래스 단위로 공유
+    _BRUSH = None
+    _PEN_OUTLINE = QPen(Qt.GlobalColor.black, 2)
+    _PEN_TEXT = QPen(Qt.GlobalColor.black)
+    _FONT = None
     
     def __init__(self, wire_spacing):
         super().__init__()
@@ -379,51 +778,99 @@ class OracleGateItem(QGraphicsRectItem):
 
         self.setRect(0, 0, self.WIDTH, height)
 
-        self.setBrush(QColor("#E6F0FF"))
-        self.setPen(QPen(Qt.GlobalColor.black, 2))
+        if OracleGateItem._BRUSH is None:
+            OracleGateItem._BRUSH = QBrush(QColor("#E6F0FF"))
+        self.setBrush(OracleGateItem._BRUSH)
+        self.setPen(OracleGateItem._PEN_OUTLINE)
 
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, False)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, False)
 
         self.setZValue(10)
+        # paint() 결과를 픽스맵으로 캐시 - 스크롤/드래그 중에는 다시 그리지 않음
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
     
     def paint(self, painter, option, widget):
         # 배경 사각형 그리기
         super().paint(painter, option, widget)
         
         # "Uf" 텍스트 그리기
-        font = QFont("Malgun Gothic", 10, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.setPen(QPen(Qt.GlobalColor.black))
-        
-        rect = self.rect()
-        text_rect = QRectF(rect.x(), rect.y(), rect.width(), rect.height())
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, "Uf")
+        if OracleGateItem._FONT is None:
+            OracleGateItem._FONT = QFont("Malgun Gothic", 10, QFont.Weight.Bold)
+        painter.setFont(OracleGateItem._FONT)
+        painter.setPen(OracleGateItem._PEN_TEXT)
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Uf")
     
     
 
 
+# OpenGL 뷰포트 사용 가능 여부: 모듈이 있고, 헤드리스 플랫폼이 아니며, 실제로 GL 컨텍스트를 만들 수 있어야 함
+# (드라이버가 없거나 깨진 환경에서는 빈 화면 대신 래스터 뷰포트로 되돌아감)
+@functools.lru_cache(maxsize=1)
+def _opengl_available() -> bool:
+    if QOpenGLWidget is None or QApplication.platformName() in ("offscreen", "minimal"):
+        return False
+    try:
+        return QOpenGLContext().create()
+    except Exception:
+        return False
+
+
 class CircuitView(QGraphicsView):
 
-    def __init__(self):
+    def __init__(self, cfg: CircuitViewCfg = CircuitViewCfg()):
         super().__init__()
 
         # 기본 Scene
+        # 아이템이 적고(수백 개 이하) 드래그로 계속 움직이므로 BSP 인덱스 대신 선형 탐색 사용
         self.scene = QGraphicsScene()
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
 
+        # 렌더링: OpenGL 뷰포트가 가능하면 GPU로 그리고 매 프레임 전체 갱신 (GL은 부분 갱신이 오히려 느림)
+        # 아니면 래스터 뷰포트에서 바뀐 영역들을 감싸는 사각형 하나만 다시 그림
+        if _opengl_available():
+            self.setViewport(QOpenGLWidget())
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
+
         # 고정 UI 설정
-        self.WIRE_SHIFT = -30
+        self.cfg = cfg
+        self.WIRE_SHIFT = cfg.wire_shift
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         # 패널 상태
         self.n_qubits = N_QUBITS
         self.circuit: Dict[Tuple[int, int], GateItem] = {}
+        # 열 인덱스: col -> {row: GateItem}, circuit과 항상 함께 갱신 (_place/_unplace)
+        self.bycol: Dict[int, Dict[int, GateItem]] = {}
+        # 행 인덱스: row -> {col: GateItem} (큐비트 삭제 시 해당 행만 조회)
+        self.byrow: Dict[int, Dict[int, GateItem]] = {}
+        # bycol의 열 번호를 정렬된 상태로 유지 (내보낼 때마다 정렬하지 않도록)
+        self._cols: List[int] = []
+        # 중복 검사용 인덱스: col -> 타겟(X_T/Z_T) 행, row -> 측정 게이트 열
+        self.col_targets: Dict[int, Set[int]] = {}
+        self.row_measures: Dict[int, Set[int]] = {}
+        # export_gate_infos / iter_by_column 결과 캐시 (_place/_unplace/각도 변경 시 무효화)
+        self._columns_cache: Optional[List[Tuple[int, List[GateInfo]]]] = None
+        self._gate_infos_cache: Optional[List[GateInfo]] = None
         self.palette_gate: Optional[GateItem] = None
-        self.connection_lines: List = []
+        # 열(col)별 CTRL ↔ TARGET 연결선 (열마다 경로 아이템 하나)
+        self.connection_lines: Dict[int, QGraphicsPathItem] = {}
         self.bloch_callback = None
 
+        # 와이어 라벨 아이템 (큐비트별 [라벨, Bloch 버튼], classical bit 라벨)
+        # 와이어 선 자체는 drawBackground에서 캐시된 pixmap으로 그림
+        self._wire_rows: List[List[QGraphicsItem]] = []
+        self._cbit_label = None
+        self._wire_tile: Optional[QPixmap] = None
+        # 쓰레기통 아이템 ([사각형, 아이콘]) - 한 번 만들고 계속 재사용
+        self._trash_items: Optional[List[QGraphicsItem]] = None
+        # 배치된 Oracle 게이트 (scene 전체를 훑지 않고 바로 찾도록 보관)
+        self._oracle_item: Optional[OracleGateItem] = None
+
         # Scene 크기 계산
         self._update_scene_rect()
 
@@ -436,10 +883,7 @@ class CircuitView(QGraphicsView):
         return MAX_COLS // 2
 
     def has_oracle_gate(self):
-        return any(
-            getattr(item, "gate_type", None) == "ORACLE"
-            for item in self.scene.items()
-        )
+        return self._oracle_item is not None
 
 
     def insert_oracle_gate(self):
@@ -456,6 +900,7 @@ class CircuitView(QGraphicsView):
 
         gate.setPos(x, y)
         self.scene.addItem(gate)
+        self._oracle_item = gate
 
         self.reserved_columns.add(col)
 
@@ -464,6 +909,8 @@ class CircuitView(QGraphicsView):
     # ----------------------------------------------------------
     def set_bloch_callback(self, func):
         self.bloch_callback = func
+        # Bloch 버튼을 붙여야 하므로 라벨 행만 새로 만듦
+        self._trim_wire_rows(0)
         self.draw_all()
 
     # ----------------------------------------------------------
@@ -473,6 +920,8 @@ class CircuitView(QGraphicsView):
         return X_OFFSET + CELL_WIDTH * MAX_COLS
 
     def _compute_scene_height(self):
+        if self.cfg.scene_height is not None:
+            return self.cfg.scene_height
         return Y_OFFSET + (self.n_qubits + 1) * ROW_HEIGHT + 200
 
     def _update_scene_rect(self):
@@ -483,250 +932,239 @@ class CircuitView(QGraphicsView):
         # 쓰레기통 위치
         self.trash_rect = QRectF(right - 90, 10, 70, 60)
 
-        # View 최소 높이
-        self.setMinimumHeight(int(height) + 40)
+        # View 최소 높이 (고정 높이 설정이면 위젯 높이는 소유자가 관리)
+        if self.cfg.scene_height is None:
+            self.setMinimumHeight(int(height) + 40)
 
     # ----------------------------------------------------------
     # 전체 다시 그리기
     # ----------------------------------------------------------
-    def draw_all(self):
-        """전체 화면 다시 그리기"""
-        if not self.isVisible():
-            return
-            
+    @contextlib.contextmanager
+    def _bulk_update(self):
+        """아이템을 한꺼번에 추가/이동/제거할 때 화면 갱신을 끝날 때 한 번으로 미룸"""
         self.setUpdatesEnabled(False)
-        
+        was_blocked = self.scene.blockSignals(True)
         try:
-            items_list = list(self.scene.items())
-
-            # 1) 배경만 제거 (와이어, 라벨, 연결선, 쓰레기통) - 게이트와 게이트 자식은 건드리지 않음
-            for it in items_list:
-                if isinstance(it, (GateItem, OracleGateItem, QGraphicsTextItem)):
-                    continue
-                # 게이트의 자식도 건드리지 않음
-                parent = it.parentItem() if hasattr(it, 'parentItem') else None
-                if isinstance(parent, (GateItem, OracleGateItem)):
-                    continue
-                if it.scene() is self.scene:
-                    try:
-                        self.scene.removeItem(it)
-                    except:
-                        pass
-
-            # 2) 연결선 제거
-            for l in list(self.connection_lines):
-                try:
-                    if l.scene() is self.scene:
-                        self.scene.removeItem(l)
-                except:
-                    pass
-            self.connection_lines.clear()
-
-            # 3) 배경 재구성
-            self._draw_wires()
-            self._draw_trash()
-
-            # 4) 게이트 위치 수정 (이미 scene에 있는 게이트들)
-            for (r, c), g in list(self.circuit.items()):
-                # 범위 벗어난 게이트 제거
-                if r < 0 or r >= self.n_qubits or c < 0 or c >= MAX_COLS:
-                    try:
-                        if g.scene() is self.scene:
-                            self.scene.removeItem(g)
-                    except:
-                        pass
-                    try:
-                        del self.circuit[(r, c)]
-                    except:
-                        pass
-                else:
-                    # 유효한 범위 내 게이트 위치 업데이트
-                    try:
-                        if g.scene() is not self.scene:
-                            self.scene.addItem(g)
-                        x = X_OFFSET + c * CELL_WIDTH - g.WIDTH / 2
-                        y = Y_OFFSET + r * ROW_HEIGHT - g.HEIGHT / 2
-                        g.setPos(x, y)
-                        # ★ 텍스트 업데이트 및 표시
-                        if hasattr(g, 'text') and g.text is not None:
-                            g.update_text()
-                            g.text.show()
-                    except:
-                        pass
-
-            # 5) 연결선 재구성
-            self._draw_connections()
-            
+            yield
         finally:
+            self.scene.blockSignals(was_blocked)
             self.setUpdatesEnabled(True)
+            self.viewport().update()
 
-    def _compute_scene_height(self):
-        return Y_OFFSET + (self.n_qubits + 1) * ROW_HEIGHT + 200
-
-    def _update_scene_rect(self):
-        right = self.get_right_end()
-        height = self._compute_scene_height()
-        self.setSceneRect(0, 0, right + 200, height)
-
-        # 쓰레기통 위치
-        self.trash_rect = QRectF(right - 90, 10, 70, 60)
-
-        # View 최소 높이
-        self.setMinimumHeight(int(height) + 40)
-
-    # ----------------------------------------------------------
-    # 전체 다시 그리기
-    # ----------------------------------------------------------
     def draw_all(self):
-        """전체 화면 다시 그리기"""
-        self.setUpdatesEnabled(False)
-        
-        items = list(self.scene.items())
-
-        # 1) 배경 제거 (와이어, 라벨, 연결선, 쓰레기통)
-        for it in items:
-            if isinstance(it, (GateItem, OracleGateItem)):
-                continue
-            if it.scene() is self.scene:
-                self.scene.removeItem(it)
-
-        # 2) circuit에 없는 GateItem 제거
-        for it in items:
-            if isinstance(it, GateItem):
-                key = (it.row, it.col)
-                if key not in self.circuit:
-                    it.setGraphicsEffect(None)
-                    it.shadow = None
-                    if it.scene() is self.scene:
-                        self.scene.removeItem(it)
-
-        # 3) palette_gate 제거
-        if self.palette_gate is not None:
-            if self.palette_gate.scene() is self.scene:
-                self.scene.removeItem(self.palette_gate)
-            self.palette_gate = None
-
-        # 4) 연결선 제거
-        for l in list(self.connection_lines):
-            if l.scene() is self.scene:
-                self.scene.removeItem(l)
-        self.connection_lines.clear()
+        """전체 화면 동기화 (배경 아이템은 다시 만들지 않고 재사용)"""
+        with self._bulk_update():
+            # 1) 와이어 라벨/쓰레기통 동기화 - 큐비트 수가 바뀐 만큼만 증감
+            self._sync_wires()
+            self._sync_trash()
+
+            # 2) palette_gate 제거
+            if self.palette_gate is not None:
+                if self.palette_gate.scene() is self.scene:
+                    self.scene.removeItem(self.palette_gate)
+                self.palette_gate = None
 
-        # 5) 배경 재구성
-        self._draw_wires()
-        self._draw_trash()
+            # 3) 큐비트 범위를 벗어난 행의 게이트는 행 인덱스로 찾아 제거
+            dirty_cols = set()
+            for r in [r for r in self.byrow if r >= self.n_qubits]:
+                for c in list(self.byrow[r]):
+                    self._unplace((r, c))
+                    dirty_cols.add(c)
 
-        # 6) 게이트 위치 업데이트 및 재추가
-        for (r, c), g in list(self.circuit.items()):
-            if r >= self.n_qubits:
-                del self.circuit[(r, c)]
-            else:
-                if g not in self.scene.items():
+            # 4) 게이트 위치 업데이트 및 재추가
+            for (r, c), g in self.circuit.items():
+                if g.scene() is not self.scene:
                     self.scene.addItem(g)
                 x = X_OFFSET + c * CELL_WIDTH - g.WIDTH / 2
                 y = Y_OFFSET + r * ROW_HEIGHT - g.HEIGHT / 2
                 g.setPos(x, y)
 
-        # 7) 연결선 재구성
-        self._draw_connections()
-        
-        self.setUpdatesEnabled(True)
+            # 5) 연결선 - 바뀐 열만 다시 그림
+            self._sync_multi_qubit_ops(dirty_cols)
 
 
     # ----------------------------------------------------------
     # 와이어 + 라벨 + Bloch 버튼
     # ----------------------------------------------------------
     def _draw_wires(self):
-        pen = QPen(Qt.GlobalColor.black)
-        pen.setWidth(2)
-        right = self.get_right_end()
-
-        for i in range(self.n_qubits):
-            y = Y_OFFSET + i * ROW_HEIGHT
-
-            # 와이어
-            self.scene.addLine(
-                X_OFFSET + self.WIRE_SHIFT, y,
-                right + self.WIRE_SHIFT, y, pen
-            )
+        self._wire_rows = [self._make_wire_row(i) for i in range(self.n_qubits)]
 
-            # 라벨
-            lbl = QGraphicsTextItem(f"q[{i}]")
-            lbl.setFont(QFont("Segoe UI", 11))
-            lbl.setDefaultTextColor(Qt.GlobalColor.black)
-            lbl.setPos(X_OFFSET + self.WIRE_SHIFT - 40, y - 10)
-            self.scene.addItem(lbl)
-
-            # Bloch 버튼
-            if self.bloch_callback:
-                bx = right + self.WIRE_SHIFT + 10
-                by = y - BlochButtonItem.HEIGHT / 2
-                btn = BlochButtonItem(i, self.bloch_callback, bx, by)
-                self.scene.addItem(btn)
-
-        # classical bit line
+        # classical bit 라벨 (라인은 drawBackground에서 그림)
         y2 = Y_OFFSET + self.n_qubits * ROW_HEIGHT
-        self.scene.addLine(
-            X_OFFSET + self.WIRE_SHIFT, y2,
-            right + self.WIRE_SHIFT, y2, pen
-        )
         txt = QGraphicsTextItem(f"c({self.n_qubits})")
         txt.setFont(QFont("Segoe UI", 12))
         txt.setDefaultTextColor(Qt.GlobalColor.black)
         txt.setPos(X_OFFSET + self.WIRE_SHIFT - 40, y2 - 10)
+        # 라벨은 큐비트 수가 바뀔 때만 달라지므로 픽스맵 캐시 재사용
+        txt.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.scene.addItem(txt)
+        self._cbit_label = txt
+        self.resetCachedContent()
+
+    def _make_wire_row(self, i):
+        """i번째 큐비트의 라벨/Bloch 버튼을 만들고 리스트로 반환"""
+        right = self.get_right_end()
+        y = Y_OFFSET + i * ROW_HEIGHT
+
+        # 라벨
+        lbl = QGraphicsTextItem(f"q[{i}]")
+        lbl.setFont(QFont("Segoe UI", 11))
+        lbl.setDefaultTextColor(Qt.GlobalColor.black)
+        lbl.setPos(X_OFFSET + self.WIRE_SHIFT - 40, y - 10)
+        lbl.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.scene.addItem(lbl)
+        row_items = [lbl]
+
+        # Bloch 버튼
+        if self.bloch_callback:
+            bx = right + self.WIRE_SHIFT + 10
+            by = y - BlochButtonItem.HEIGHT / 2
+            btn = BlochButtonItem(i, self.bloch_callback, bx, by)
+            self.scene.addItem(btn)
+            row_items.append(btn)
+
+        return row_items
+
+    def _sync_wires(self):
+        """와이어 라벨이 없으면 새로 그리고, 있으면 큐비트 수에 맞춰 재배치"""
+        if self._cbit_label is None:
+            self._draw_wires()
+        else:
+            self._relayout_wires()
+
+    def _trim_wire_rows(self, n):
+        """n번째 이후의 라벨/Bloch 버튼 행 제거"""
+        while len(self._wire_rows) > n:
+            for it in self._wire_rows.pop():
+                if it.scene() is self.scene:
+                    self.scene.removeItem(it)
+
+    def _relayout_wires(self):
+        """큐비트 수 변경 시 와이어만 증감/재배치 (게이트, 쓰레기통은 그대로)"""
+        self._trim_wire_rows(self.n_qubits)
+        while len(self._wire_rows) < self.n_qubits:
+            self._wire_rows.append(self._make_wire_row(len(self._wire_rows)))
+
+        y2 = Y_OFFSET + self.n_qubits * ROW_HEIGHT
+        self._cbit_label.setPlainText(f"c({self.n_qubits})")
+        self._cbit_label.setPos(X_OFFSET + self.WIRE_SHIFT - 40, y2 - 10)
+
+        # 와이어 선은 배경이므로 타일 영역만 다시 그리면 됨
+        self.resetCachedContent()
+        self.viewport().update()
+
+    def _get_wire_tile(self):
+        """와이어 한 줄(ROW_HEIGHT 높이 띠)을 그린 pixmap을 만들어 캐시"""
+        dpr = self.devicePixelRatioF()
+        tile = self._wire_tile
+        if tile is None or tile.devicePixelRatio() != dpr:
+            # 펜 두께(2)의 사각 끝모양만큼 좌우 1px 여유
+            w = self.get_right_end() - X_OFFSET + 2
+            tile = QPixmap(int(w * dpr), int(ROW_HEIGHT * dpr))
+            tile.setDevicePixelRatio(dpr)
+            tile.fill(Qt.GlobalColor.transparent)
+            p = QPainter(tile)
+            pen = QPen(Qt.GlobalColor.black)
+            pen.setWidth(2)
+            p.setPen(pen)
+            p.drawLine(1, ROW_HEIGHT // 2, w - 1, ROW_HEIGHT // 2)
+            p.end()
+            self._wire_tile = tile
+        return tile
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        # 큐비트 와이어 n개 + classical bit 라인 1개를 같은 타일로 세로 반복
+        x0 = X_OFFSET + self.WIRE_SHIFT - 1
+        y0 = Y_OFFSET - ROW_HEIGHT // 2
+        band = QRectF(
+            x0, y0,
+            self.get_right_end() - X_OFFSET + 2,
+            (self.n_qubits + 1) * ROW_HEIGHT
+        )
+        target = band.intersected(rect)
+        if target.isEmpty():
+            return
+        painter.drawTiledPixmap(
+            target, self._get_wire_tile(),
+            QPointF(target.x() - band.x(), target.y() - band.y())
+        )
 
     # ----------------------------------------------------------
     def _draw_trash(self):
         pen = QPen(Qt.GlobalColor.black)
         brush = QBrush(QColor("#FFDDDD"))
-        self.scene.addRect(self.trash_rect, pen, brush)
+        rect = self.scene.addRect(self.trash_rect, pen, brush)
 
         t = QGraphicsTextItem("🗑")
         t.setFont(QFont("Segoe UI", 20))
         t.setDefaultTextColor(Qt.GlobalColor.black)
         t.setPos(self.trash_rect.x() + 18, self.trash_rect.y() + 8)
         self.scene.addItem(t)
+        # 쓰레기통은 위치만 바뀌므로 픽스맵 캐시 재사용
+        for it in (rect, t):
+            it.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self._trash_items = [rect, t]
+
+    def _sync_trash(self):
+        """쓰레기통이 없을 때만 새로 그리고, 있으면 위치만 맞춤"""
+        if self._trash_items is None:
+            self._draw_trash()
+            return
+        rect, t = self._trash_items
+        rect.setRect(self.trash_rect)
+        t.setPos(self.trash_rect.x() + 18, self.trash_rect.y() + 8)
 
     # ----------------------------------------------------------
-    def _draw_connections(self):
-        """CTRL ↔ TARGET 연결선 그리기"""
-        pen = QPen(Qt.GlobalColor.black)
-        pen.setWidth(2)
+    def _sync_multi_qubit_ops(self, cols=()):
+        """CTRL ↔ TARGET 연결선 동기화
 
-        bycol: Dict[int, List[GateItem]] = {}
-        for (r, c), g in self.circuit.items():
-            bycol.setdefault(c, []).append(g)
-
-        for col, ops in bycol.items():
-            ctrl = [g.row for g in ops if g.gate_type == "CTRL"]
-            tgt = [g for g in ops if g.gate_type in ("X_T", "Z_T")]
-
-            if not ctrl and not tgt:
-                continue
-
-            rows = ctrl + [g.row for g in tgt]
-            if len(rows) <= 1:
-                continue
-
-            top = min(rows)
-            bot = max(rows)
-
-            xmid = X_OFFSET + col * CELL_WIDTH
-            ytop = Y_OFFSET + top * ROW_HEIGHT
-            ybot = Y_OFFSET + bot * ROW_HEIGHT
-
-            # 세로 연결선
-            line = self.scene.addLine(xmid, ytop, xmid, ybot, pen)
-            line.setZValue(-1)
-            self.connection_lines.append(line)
+        연결선은 snap_gate/삭제 시 열 단위로 갱신되므로, 여기서는
+        게이트가 사라진 열과 호출자가 넘긴 열만 다시 그림.
+        """
+        stale = [c for c in self.connection_lines if c not in self.bycol]
+        for col in set(stale).union(cols):
+            self._rebuild_column_connector(col)
+
+    _CONNECTOR_PEN = QPen(Qt.GlobalColor.black, 2)
+
+    def _rebuild_column_connector(self, col):
+        """한 열(col)의 연결선만 다시 그리기"""
+        # 열 인덱스에서 CTRL/타겟 행만 한 번에 모음
+        rows = [
+            r for r, g in self.bycol.get(col, {}).items()
+            if g.gate_type in _CONNECTOR_TYPES
+        ]
+        if len(rows) <= 1:
+            item = self.connection_lines.pop(col, None)
+            if item is not None and item.scene() is self.scene:
+                self.scene.removeItem(item)
+            return
 
-            # 각 노드에 짧은 수평선
-            for r in rows:
-                cy = Y_OFFSET + r * ROW_HEIGHT
-                h = self.scene.addLine(xmid - 6, cy, xmid + 6, cy, pen)
-                h.setZValue(-1)
-                self.connection_lines.append(h)
+        top = min(rows)
+        bot = max(rows)
+
+        xmid = X_OFFSET + col * CELL_WIDTH
+        ytop = Y_OFFSET + top * ROW_HEIGHT
+        ybot = Y_OFFSET + bot * ROW_HEIGHT
+
+        # 세로 연결선 + 각 노드의 짧은 수평선을 경로 하나로
+        path = QPainterPath()
+        path.moveTo(xmid, ytop)
+        path.lineTo(xmid, ybot)
+        for r in rows:
+            cy = Y_OFFSET + r * ROW_HEIGHT
+            path.moveTo(xmid - 6, cy)
+            path.lineTo(xmid + 6, cy)
+
+        # 이미 있는 경로 아이템은 경로만 교체
+        item = self.connection_lines.get(col)
+        if item is not None:
+            item.setPath(path)
+            return
+        item = self.scene.addPath(path, self._CONNECTOR_PEN)
+        item.setZValue(-1)
+        self.connection_lines[col] = item
 
     # ----------------------------------------------------------
     # PALETTE → 드래그 상태 설정
@@ -748,6 +1186,9 @@ class CircuitView(QGraphicsView):
     # ----------------------------------------------------------
     # SNAP LOGIC (핵심)
     # ----------------------------------------------------------
+    _HALF_CELL = CELL_WIDTH / 2
+    _HALF_ROW = ROW_HEIGHT / 2
+
     def snap_gate(self, g: GateItem):
         
         if getattr(g, "gate_type", None) == "ORACLE":
@@ -768,37 +1209,45 @@ class CircuitView(QGraphicsView):
         if (trash_x <= cx <= trash_x + trash_w and 
             trash_y <= cy <= trash_y + trash_h):
             if g.row is not None:
-                self.circuit.pop((g.row, g.col), None)
+                self._unplace((g.row, g.col))
+                self._rebuild_column_connector(g.col)
             self.scene.removeItem(g)
             if g is self.palette_gate:
                 self.palette_gate = None
-            self.draw_all()
             return
 
         # (2) 팔레트 영역 → 스냅 취소
         if cy < Y_OFFSET - 40:
             if g.row is not None:
-                self.circuit.pop((g.row, g.col), None)
+                self._unplace((g.row, g.col))
+                self._rebuild_column_connector(g.col)
                 g.row = g.col = None
             self.scene.removeItem(g)
             if g is self.palette_gate:
                 self.palette_gate = None
-            self.draw_all()
             return
 
-        # (3) 그리드 위치 계산
-        col = round((cx - X_OFFSET) / CELL_WIDTH)
-        row = round((cy - Y_OFFSET) / ROW_HEIGHT)
+        # (3) 그리드 위치 계산 (가장 가까운 칸 - 반 칸 더한 뒤 내림)
+        col = int((cx - X_OFFSET + self._HALF_CELL) // CELL_WIDTH)
+        row = int((cy - Y_OFFSET + self._HALF_ROW) // ROW_HEIGHT)
 
         # ★ 먼저 이전 위치 저장
         old = (g.row, g.col) if g.row is not None else None
 
+        # 제자리 드롭(클릭만 한 경우)은 위치만 다시 맞추고 종료
+        if old is not None and (row, col) == old:
+            g.setPos(
+                X_OFFSET + col * CELL_WIDTH - g.WIDTH / 2,
+                Y_OFFSET + row * ROW_HEIGHT - g.HEIGHT / 2
+            )
+            return
+
         # ★ classical bit 영역 확인 (n_qubits 이상이면 팔레트로 복구)
-        if row < 0 or row >= self.n_qubits or col < 0 or col >= MAX_COLS:
+        if not (0 <= row < self.n_qubits and 0 <= col < MAX_COLS):
             # 유효하지 않은 영역 - 이전 위치로 돌아가기
             if old is not None:
                 # 이전에 circuit에 있었으면 그 위치로 복구
-                self.circuit[old] = g
+                self._place(old, g)
                 g.row, g.col = old
                 g.setPos(
                     X_OFFSET + old[1] * CELL_WIDTH - g.WIDTH / 2,
@@ -812,29 +1261,18 @@ class CircuitView(QGraphicsView):
                     self.palette_gate = None
             return
 
-        # 안전한 범위로 제한
-        col = max(0, min(col, MAX_COLS - 1))
-        row = max(0, min(row, self.n_qubits - 1))
-
         new = (row, col)
 
-        # (4) 다중 타겟/측정 게이트 방지
-        other_targets = [
-            gg for (rr, cc), gg in self.circuit.items()
-            if cc == col and gg.gate_type in ("X_T", "Z_T") and gg is not g
-        ]
+        # (4) 다중 타겟/측정 게이트 방지 (인덱스 조회, g 자신의 자리는 제외)
+        other_targets = self.col_targets.get(col, set()) - ({old[0]} if old and old[1] == col else set())
         # 같은 행(row)에 M 게이트가 이미 있으면 배치 거절
-        other_measures = [
-            gg for (rr, cc), gg in self.circuit.items()
-            if rr == row and gg.gate_type == "MEASURE" and gg is not g
-        ]
+        other_measures = self.row_measures.get(row, set()) - ({old[1]} if old and old[0] == row else set())
         
-        if g.gate_type in ("X_T", "Z_T") and other_targets:
+        if g.gate_type in _TARGET_TYPES and other_targets:
             if old is None:
                 self.scene.removeItem(g)
                 if g is self.palette_gate:
                     self.palette_gate = None
-                self.draw_all()
                 return
             else:
                 g.setPos(
@@ -849,7 +1287,6 @@ class CircuitView(QGraphicsView):
                 self.scene.removeItem(g)
                 if g is self.palette_gate:
                     self.palette_gate = None
-                self.draw_all()
                 return
             else:
                 g.setPos(
@@ -858,9 +1295,22 @@ class CircuitView(QGraphicsView):
                 )
                 return
 
+        # Oracle 등으로 예약된 열이면 circuit을 건드리기 전에 거절
+        if col in self.reserved_columns:
+            if old is not None:
+                g.setPos(
+                    X_OFFSET + old[1] * CELL_WIDTH - g.WIDTH / 2,
+                    Y_OFFSET + old[0] * ROW_HEIGHT - g.HEIGHT / 2
+                )
+            else:
+                self.scene.removeItem(g)
+                if g is self.palette_gate:
+                    self.palette_gate = None
+            return
+
         # (5) 기존 위치 제거
         if old in self.circuit:
-            del self.circuit[old]
+            self._unplace(old)
 
         # (6) 새 위치에 Gate가 있으면 처리
         existing = self.circuit.get(new)
@@ -874,17 +1324,33 @@ class CircuitView(QGraphicsView):
                     self.palette_gate = None
                 return
             else:
-                # 기존 위치(old)가 있는 경우에만 스왑
-                self.circuit[old] = existing
+                # 기존 위치(old)가 있는 경우에만 스왑 (new의 인덱스 항목을 먼저 지움)
+                self._unplace(new)
+                self._place(old, existing)
                 existing.row, existing.col = old
                 existing.setPos(
                     X_OFFSET + old[1] * CELL_WIDTH - existing.WIDTH / 2,
                     Y_OFFSET + old[0] * ROW_HEIGHT - existing.HEIGHT / 2
                 )
 
-        if not self._is_valid_column(col):
+        # 스왑으로 기존 게이트가 old로 옮겨졌으면 그 열(타겟)과 행(측정)도 검사
+        swap_invalid = existing is not None and (
+            not self._is_valid_column(old[1])
+            or (existing.gate_type == "MEASURE" and old[0] != row
+                and len(self.row_measures.get(old[0], ())) > 1)
+        )
+        if not self._is_valid_column(col) or swap_invalid:
+            if existing is not None:
+                # 스왑 되돌리기: 기존 게이트를 new로 복귀
+                self._unplace(old)
+                self._place(new, existing)
+                existing.row, existing.col = new
+                existing.setPos(
+                    X_OFFSET + col * CELL_WIDTH - existing.WIDTH / 2,
+                    Y_OFFSET + row * ROW_HEIGHT - existing.HEIGHT / 2
+                )
             if old is not None:
-                self.circuit[old] = g
+                self._place(old, g)
                 g.row, g.col = old
                 g.setPos(
                     X_OFFSET + old[1]* CELL_WIDTH - g.WIDTH / 2,
@@ -892,23 +1358,10 @@ class CircuitView(QGraphicsView):
                 )
             else:
                 self.scene.removeItem(g)
-            if existing is not None:
-                self.circuit[new] = existing
-            return
-        
-        if col in self.reserved_columns:
-            if hasattr(g, "row") and g.row is not None:
-                g.setPos(
-                    X_OFFSET + g.col * CELL_WIDTH - g.WIDTH / 2,
-                    Y_OFFSET + g.row * ROW_HEIGHT - g.HEIGHT / 2
-                )
-            else:
-                self.scene.removeItem(g)
             return
         
-
         # (7) 새 위치 등록
-        self.circuit[new] = g
+        self._place(new, g)
         g.row, g.col = row, col
         g.setPos(
             X_OFFSET + col * CELL_WIDTH - g.WIDTH / 2,
@@ -922,17 +1375,16 @@ class CircuitView(QGraphicsView):
         if g is self.palette_gate:
             self.palette_gate = None
 
-        # (8) 전체 다시 그리기
-        self.draw_all()
+        # (8) 영향 받은 열의 연결선만 다시 그리기
+        if old is not None and old[1] != col:
+            self._rebuild_column_connector(old[1])
+        self._rebuild_column_connector(col)
 
     def remove_oracle_gate(self):
         """Oracle 게이트 제거"""
         try:
-            oracle_items = [
-                item for item in self.scene.items()
-                if getattr(item, "gate_type", None) == "ORACLE"
-            ]
-            for item in oracle_items:
+            item, self._oracle_item = self._oracle_item, None
+            if item is not None:
                 try:
                     if item.scene() is self.scene:
                         self.scene.removeItem(item)
@@ -949,14 +1401,24 @@ class CircuitView(QGraphicsView):
             self.setUpdatesEnabled(False)
             self.scene.blockSignals(True)
             
-            # 2) circuit 딕셔너리 초기화
+            # 2) circuit 딕셔너리 / 열 인덱스 초기화
             self.circuit.clear()
+            self.bycol.clear()
+            self.byrow.clear()
+            self._cols.clear()
+            self.col_targets.clear()
+            self.row_measures.clear()
+            self._invalidate_export_cache()
             
             # 3) palette_gate 초기화
             self.palette_gate = None
             
-            # 4) 연결선 초기화
+            # 4) 연결선/배경 아이템 목록 초기화
             self.connection_lines.clear()
+            self._wire_rows = []
+            self._cbit_label = None
+            self._trash_items = None
+            self._oracle_item = None
             
             # 5) Scene의 모든 아이템 제거
             self.scene.clear()
@@ -972,8 +1434,9 @@ class CircuitView(QGraphicsView):
         
         # 6) 배경 재구성
         try:
-            self._draw_wires()
-            self._draw_trash()
+            with self._bulk_update():
+                self._draw_wires()
+                self._draw_trash()
         except Exception as e:
             print(f"draw background error: {e}")
 
@@ -983,38 +1446,107 @@ class CircuitView(QGraphicsView):
     # ----------------------------------------------------------
     def keyPressEvent(self, e):
         if e.key() == Qt.Key.Key_Delete:
+            cols = set()
             for it in list(self.scene.selectedItems()):
                 if isinstance(it, GateItem):
                     if it.row is not None:
-                        self.circuit.pop((it.row, it.col), None)
+                        self._unplace((it.row, it.col))
+                        cols.add(it.col)
                     if it is self.palette_gate:
                         self.palette_gate = None
                     self.scene.removeItem(it)
-            self.draw_all()
+            for col in cols:
+                self._rebuild_column_connector(col)
         else:
             super().keyPressEvent(e)
 
     # ----------------------------------------------------------
     # Gate Export for Qiskit
     # ----------------------------------------------------------
+    def iter_by_column(self) -> Iterator[Tuple[int, List[GateInfo]]]:
+        """(col, 해당 열의 GateInfo 목록)을 열 순서대로, 각 목록은 행 순서로 반환 (읽기 전용)"""
+        if self._columns_cache is None:
+            # 열 인덱스(bycol)와 정렬된 열 목록을 사용하므로 다시 묶거나 정렬할 필요 없음
+            columns = []
+            for c in self._cols:
+                column = self.bycol[c]
+                ops = []
+                for r in sorted(column):
+                    g = column[r]
+                    ang = (
+                        g.angle
+                        if g.gate_type in _ROTATION_TYPES and g.angle is not None
+                        else 0
+                    )
+                    ops.append(GateInfo(g.gate_type, r, c, ang))
+                if ops:
+                    columns.append((c, ops))
+            self._columns_cache = columns
+        return iter(self._columns_cache)
+
     def export_gate_infos(self) -> List[GateInfo]:
-        out = []
-        for (r, c), g in self.circuit.items():
-            ang = (
-                g.angle
-                if g.gate_type in ("RX", "RY", "RZ") and g.angle is not None
-                else 0
-            )
-            out.append(GateInfo(g.gate_type, r, c, ang))
-        return sorted(out, key=lambda x: (x.col, x.row))
+        """(col, row) 순서의 GateInfo 목록 (읽기 전용, 회로가 바뀔 때까지 같은 리스트 반환)"""
+        if self._gate_infos_cache is None:
+            # iter_by_column이 이미 (col, row) 순서로 내보내므로 별도 정렬 불필요
+            self._gate_infos_cache = [info for _, ops in self.iter_by_column() for info in ops]
+        return self._gate_infos_cache
+
+    def _invalidate_export_cache(self):
+        """게이트 배치/각도가 바뀌면 호출 - 다음 조회 때 GateInfo 목록을 다시 만듦"""
+        self._columns_cache = None
+        self._gate_infos_cache = None
+
+    # ----------------------------------------------------------
+    # circuit / 열 인덱스 동시 갱신
+    # ----------------------------------------------------------
+    def _place(self, key, g):
+        r, c = key
+        self._invalidate_export_cache()
+        self.circuit[key] = g
+        column = self.bycol.get(c)
+        if column is None:
+            column = self.bycol[c] = {}
+            bisect.insort(self._cols, c)
+        column[r] = g
+        self.byrow.setdefault(r, {})[c] = g
+        if g.gate_type in _TARGET_TYPES:
+            self.col_targets.setdefault(c, set()).add(r)
+        elif g.gate_type == "MEASURE":
+            self.row_measures.setdefault(r, set()).add(c)
+
+    def _unplace(self, key):
+        r, c = key
+        self._invalidate_export_cache()
+        g = self.circuit.pop(key, None)
+        column = self.bycol.get(c)
+        if column is not None:
+            column.pop(r, None)
+            if not column:
+                del self.bycol[c]
+                self._cols.remove(c)
+        row = self.byrow.get(r)
+        if row is not None:
+            row.pop(c, None)
+            if not row:
+                del self.byrow[r]
+        if g is not None:
+            if g.gate_type in _TARGET_TYPES:
+                self._discard_index(self.col_targets, c, r)
+            elif g.gate_type == "MEASURE":
+                self._discard_index(self.row_measures, r, c)
+        return g
+
+    @staticmethod
+    def _discard_index(index, key, value):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(value)
+            if not bucket:
+                del index[key]
 
     # 한 열에 타겟 게이트 여러개인지 체크
     def _is_valid_column(self, col):
-        targets = [
-            g for (r, c), g in self.circuit.items()
-            if c == col and g.gate_type in ("X_T", "Z_T")
-        ]
-        return len(targets) <= 1
+        return len(self.col_targets.get(col, ())) <= 1
 
 # ============================================================
 # PALETTE VIEW
@@ -1024,7 +1556,9 @@ class PaletteView(QGraphicsView):
         super().__init__()
 
         self.circuit_view = circuit_view
+        # 팔레트 게이트 11개뿐이라 BSP 인덱스 없이 선형 탐색
         self.scene = QGraphicsScene()
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
 
         self.setFixedWidth(160)
@@ -1075,6 +1609,77 @@ class PaletteView(QGraphicsView):
 
 
 
+# ============================================================
+# SIMULATION WORKER
+# ============================================================
+class SimSignals(QObject):
+    """SimWorker 결과 전달용 시그널 (QRunnable은 QObject가 아니므로 분리)"""
+    finished = pyqtSignal(dict, int)   # (counts, shots)
+    failed = pyqtSignal(str)
+    compiled = pyqtSignal(object, object)   # (캐시 키, (transpile된 템플릿, Parameter 목록))
+
+
+class SimWorker(QRunnable):
+    """AerSimulator 실행을 UI 스레드 밖(QThreadPool)에서 처리하는 작업"""
+
+    def __init__(self, qc, sim, shots=1024, key=None, params=(), template=None, angles=()):
+        super().__init__()
+        self.signals = SimSignals()
+        self._qc = qc
+        self._sim = sim
+        self._shots = shots
+        self._key = key
+        self._params = params
+        self._template = template
+        self._angles = angles
+
+    def run(self):
+        try:
+            # 캐시에 없는 구조만 transpile 하고 템플릿을 UI 스레드로 넘김
+            if self._template is None:
+                # 작은 회로는 optimization_level=1로도 충분하고 컴파일이 빠름
+                tqc = transpile(self._qc, self._sim, optimization_level=1)
+                self._template = (tqc, list(self._params))
+                self.signals.compiled.emit(self._key, self._template)
+            tqc, params = self._template
+            # 회전 각도만 대입 (Parameter가 없으면 그대로 실행)
+            if params:
+                tqc = tqc.assign_parameters(dict(zip(params, self._angles)))
+            counts = self._sim.run(tqc, shots=self._shots).result().get_counts()
+        except Exception as e:
+            self.signals.failed.emit(f"{e}")
+            return
+        self.signals.finished.emit(dict(counts), self._shots)
+
+
+class BlochSignals(QObject):
+    """BlochWorker 결과 전달용 시그널"""
+    finished = pyqtSignal(int, object)   # (요청 번호, (접두 상태, 상태 벡터, 축약 상태))
+    failed = pyqtSignal(int, str)
+
+
+class BlochWorker(QRunnable):
+    """얽힌 회로의 상태 벡터 진화 + 1-큐비트 축약을 UI 스레드 밖에서 처리하는 작업"""
+
+    def __init__(self, token, prefix, columns, n, target):
+        super().__init__()
+        self.signals = BlochSignals()
+        self._token = token
+        self._prefix = prefix
+        self._columns = columns
+        self._n = n
+        self._target = target
+
+    def run(self):
+        try:
+            prefix, psi = _evolve_columns(self._prefix, self._columns, self._n)
+            rho = DensityMatrix(_reduced_1q(psi, self._target, self._n))
+        except Exception as e:
+            self.signals.failed.emit(self._token, f"{e}")
+            return
+        self.signals.finished.emit(self._token, (prefix, psi, rho))
+
+
 # ============================================================
 # COMPOSER TAB (unchanged)
 # ============================================================
@@ -1123,7 +1728,13 @@ class ComposerTab(QWidget):
         self.bloch_window = BlochWindow(self)
 
         #CircuitView에 Bloch 콜백 설정
-        self.view.set_bloch_callback(self.update_single_bloch)
+        # 버튼을 연달아 누르면 BLOCH_DEBOUNCE_MS 안의 요청을 마지막 하나로 묶어 한 번만 계산
+        self._bloch_pending: Optional[int] = None
+        self._bloch_timer = QTimer(self)
+        self._bloch_timer.setSingleShot(True)
+        self._bloch_timer.setInterval(BLOCH_DEBOUNCE_MS)
+        self._bloch_timer.timeout.connect(self._do_bloch_update)
+        self.view.set_bloch_callback(self._request_bloch)
 
         # 시그널 연결
         btn_add.clicked.connect(self.add_q)
@@ -1132,6 +1743,24 @@ class ComposerTab(QWidget):
         self.btn_export.clicked.connect(self.export_qiskit)
         self.btn_measure.clicked.connect(self.run_measurement)
 
+        # 백그라운드 측정 상태
+        self._measure_running = False
+        self._measure_n_measured = 0
+        self._sim_worker: Optional[SimWorker] = None
+        # AerSimulator는 처음 측정할 때 한 번 만들고 재사용
+        self._sim: Optional[AerSimulator] = None
+        # Bloch 표시용: 회로 키 -> [상태 벡터, {큐비트: 축약 상태}], 최근에 쓴 것부터 최대 STATEVECTOR_CACHE_SIZE개
+        # (게이트를 옮겼다가 되돌려도 다시 계산하지 않음)
+        self._sv_cache: Dict[tuple, list] = {}
+        # 열 단위 접두 상태: [(열 키, 그 열까지 적용한 상태 벡터 배열)] - 바뀐 열부터만 다시 계산
+        self._sv_prefix: List[Tuple[tuple, np.ndarray]] = []
+        self._sv_prefix_n = 0
+        # 백그라운드 Bloch 계산: 요청 번호(마지막 요청만 표시) -> (작업, 캐시 키, 큐비트 수, 대상)
+        self._bloch_token = 0
+        self._bloch_workers: Dict[int, tuple] = {}
+        # 게이트 구조(각도 제외) -> (transpile된 템플릿, Parameter 목록), 오래된 것부터 버림
+        self._transpile_cache: Dict[tuple, Tuple[QuantumCircuit, List[Parameter]]] = {}
+
     # -----------------------------------------------------
     # Qubit Management
     # -----------------------------------------------------
@@ -1141,9 +1770,10 @@ class ComposerTab(QWidget):
             QMessageBox.warning(self,"Limit","Max 8 qubits")
             return
         self.view.n_qubits +=1
-        # CircuitView의 메서드 이름 통일: _update_scene_rect, draw_all
-        self.view._update_scene_rect()
-        self.view.draw_all()
+        # 게이트는 그대로 두고 scene 크기와 와이어만 갱신
+        with self.view._bulk_update():
+            self.view._update_scene_rect()
+            self.view._relayout_wires()
 
     def del_q(self):
         if self.view.n_qubits <=1:
@@ -1151,99 +1781,215 @@ class ComposerTab(QWidget):
             return
         
         remove_row = self.view.n_qubits-1
-        # 게이트 제거 로직: 큐비트 삭제 시 해당 라인의 게이트도 제거
-        for (row,col), g in list(self.view.circuit.items()):
-            if row == remove_row:
+        # 제거/재배치를 한 번의 화면 갱신으로 묶음
+        with self.view._bulk_update():
+            # 게이트 제거 로직: 큐비트 삭제 시 해당 라인의 게이트도 제거
+            # 행 인덱스로 마지막 행의 게이트만 조회
+            cols = list(self.view.byrow.get(remove_row, {}))
+            for col in cols:
+                g = self.view._unplace((remove_row, col))
                 self.view.scene.removeItem(g)
-                del self.view.circuit[(row,col)]
 
-        self.view.n_qubits -=1
-        self.view._update_scene_rect()
-        self.view.draw_all()
+            self.view.n_qubits -=1
+            self.view._update_scene_rect()
+            self.view._relayout_wires()
+            for col in cols:
+                self.view._rebuild_column_connector(col)
 
     # -----------------------------------------------------
     # Bloch Sphere Visualization (추가된 핵심 기능)
     # -----------------------------------------------------
     
+    def _has_entangling_column(self):
+        """CTRL과 타겟이 같은 열에 있는 경우가 있으면 True (없으면 각 큐비트는 독립)"""
+        bycol = self.view.bycol
+        return any(
+            any(g.gate_type == "CTRL" for g in bycol[col].values())
+            for col in self.view.col_targets
+        )
+
+    def _single_qubit_state(self, row):
+        """다른 큐비트와 얽히지 않은 row 큐비트의 상태 벡터 (측정 게이트는 무시)"""
+        qc = QuantumCircuit(1)
+        gates = self.view.byrow.get(row, {})
+        for col in sorted(gates):
+            g = gates[col]
+            _apply_column(qc, [GateInfo(g.gate_type, 0, col, g.angle)])
+        return Statevector.from_instruction(qc)
+
+    def _evolved_state(self) -> np.ndarray:
+        """현재 회로(측정 제외)를 적용한 상태 벡터 배열 - 앞쪽의 바뀌지 않은 열은 저장된 상태 재사용
+
+        Statevector로 감싸지 않고 배열 그대로 돌려주며, 호출하는 쪽에서 필요한 모양으로 reshape함.
+        """
+        n = self.view.n_qubits
+        if n != self._sv_prefix_n:
+            self._sv_prefix = []
+            self._sv_prefix_n = n
+
+        self._sv_prefix, psi = _evolve_columns(self._sv_prefix, self._column_keys(), n)
+        return psi
+
+    def _column_keys(self) -> List[Tuple[tuple, List[GateInfo]]]:
+        """[(열 키, 그 열의 GateInfo 목록)] - 열 키는 접두 상태 재사용 판단용"""
+        return [
+            ((col, tuple((g.gate_type, g.row, g.angle) for g in ops)), ops)
+            for col, ops in self.view.iter_by_column()
+        ]
+
+    def _request_bloch(self, target_qubit_idx):
+        self._bloch_pending = target_qubit_idx
+        self._bloch_timer.start()   # 실행 중이면 다시 시작 (마지막 요청만 남김)
+
+    def _do_bloch_update(self):
+        target, self._bloch_pending = self._bloch_pending, None
+        if target is not None and target < self.view.n_qubits:
+            self.update_single_bloch(target)
+
     def update_single_bloch(self, target_qubit_idx):
         """
         특정 큐비트의 상태를 계산하고 Bloch Canvas를 업데이트합니다.
         """
         try:
-            # 1. 회로 빌드
-            qc = self.build_qiskit_circuit()
-            
-            # 2. 상태 벡터 계산 (Statevector는 Qiskit에서 import 되어야 함)
-            # 
-            full_state = Statevector.from_instruction(qc)
-            
-            # 3. Partial Trace (관심 없는 큐빗 날리기)
-            all_qubits = list(range(self.view.n_qubits))
-            trace_out_qubits = [q for q in all_qubits if q != target_qubit_idx]
-            
-            # partial_trace는 Qiskit 또는 외부 유틸리티 함수여야 함
-            rho = partial_trace(full_state, trace_out_qubits)
+            # 1. 회로(큐비트 수 + 게이트 배치/각도)별로 캐시된 결과 찾기
+            #    (같은 회로에서 여러 큐비트 버튼을 누르면 이전 결과 재사용)
+            key = (self.view.n_qubits,
+                   tuple((g.gate_type, g.row, g.col, g.angle)
+                         for g in self.view.export_gate_infos()))
+            entry = self._sv_cache.pop(key, None)
+            if entry is None:
+                entry = [None, {}]
+                if len(self._sv_cache) >= STATEVECTOR_CACHE_SIZE:
+                    self._sv_cache.pop(next(iter(self._sv_cache)))
+            self._sv_cache[key] = entry   # 가장 최근에 쓴 항목으로 맨 뒤에 둠
+            rho_cache = entry[1]
+
+            # 2. 큐비트별 상태는 한 번만 계산
+            rho = rho_cache.get(target_qubit_idx)
+            if rho is None:
+                if self._has_entangling_column():
+                    # 전체 상태 벡터 → 축약 밀도 행렬 (관심 없는 큐빗 날리기)
+                    if entry[0] is None:
+                        # 상태 벡터 진화는 스레드 풀에서 하고 결과는 _on_bloch_finished에서 표시
+                        self._start_bloch_worker(key, target_qubit_idx)
+                        return
+                    rho = DensityMatrix(_reduced_1q(entry[0], target_qubit_idx, self.view.n_qubits))
+                else:
+                    # 곱 상태: 해당 행의 게이트만으로 1-큐비트 상태 벡터 계산
+                    rho = self._single_qubit_state(target_qubit_idx)
+                rho_cache[target_qubit_idx] = rho
             
-            # 4. 캔버스 업데이트
+            # 3. 캔버스 업데이트 (아직 실행 중인 이전 요청의 결과는 표시하지 않음)
+            self._bloch_token += 1
             self.bloch_window.update_bloch(rho, target_qubit_idx)
 
         except Exception as e:
             QMessageBox.warning(self, "Bloch Error", f"Calculation Failed: \n{e}")
 
+    def _start_bloch_worker(self, key, target):
+        n = self.view.n_qubits
+        if n != self._sv_prefix_n:
+            self._sv_prefix = []
+            self._sv_prefix_n = n
+        self._bloch_token += 1
+        worker = BlochWorker(self._bloch_token, self._sv_prefix, self._column_keys(), n, target)
+        worker.signals.finished.connect(self._on_bloch_finished)
+        worker.signals.failed.connect(self._on_bloch_failed)
+        # 실행 중 GC로 사라지지 않도록 끝날 때까지 참조 유지
+        self._bloch_workers[self._bloch_token] = (worker, key, n, target)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_bloch_finished(self, token, result):
+        _, key, n, target = self._bloch_workers.pop(token)
+        prefix, psi, rho = result
+        # 계산에 쓴 큐비트 수가 그대로면 접두 상태와 캐시는 최신이 아니어도 유효함
+        if n == self._sv_prefix_n:
+            self._sv_prefix = prefix
+        entry = self._sv_cache.get(key)
+        if entry is not None:
+            entry[0] = psi
+            entry[1][target] = rho
+        if token == self._bloch_token:
+            self.bloch_window.update_bloch(rho, target)
+
+    def _on_bloch_failed(self, token, message):
+        self._bloch_workers.pop(token)
+        if token == self._bloch_token:
+            QMessageBox.warning(self, "Bloch Error", f"Calculation Failed: \n{message}")
+
     # -----------------------------------------------------
     # Qiskit Circuit Builder
     # -----------------------------------------------------
 
-    def build_qiskit_circuit(self):
+    def build_qiskit_circuit(self, params: Optional[List[Parameter]] = None,
+                             col_starts: Optional[List[Tuple[int, int]]] = None):
         """
         디자이너의 게이트 배치를 기반으로 Qiskit QuantumCircuit 객체를 생성합니다.
+        params 리스트를 넘기면 회전 각도 대신 Parameter를 넣고, 만든 Parameter를
+        게이트 순서대로 params에 추가합니다.
+        col_starts 리스트를 넘기면 (열 번호, 그 열의 첫 명령 인덱스)를 추가합니다.
         """
-        infos = self.view.export_gate_infos()
         # 고전 비트 레지스터도 큐비트 수와 동일하게 생성
         qc = QuantumCircuit(self.view.n_qubits, self.view.n_qubits) 
 
-        # 열(Column)별로 게이트를 그룹화하여 순차적으로 적용
-        bycol = {}
-        for g in infos:
-            bycol.setdefault(g.col,[]).append(g)
+        # 메서드 호출(qc.h, qc.cx, ...) 대신 CircuitInstruction을 모아 한 번에 추가
+        qubits, clbits = qc.qubits, qc.clbits
+        stream: List[CircuitInstruction] = []
+        emit = stream.append
 
-        for col in sorted(bycol):
-            ops = bycol[col]
-            
-            # A. 단일 큐비트 게이트 및 측정 적용 (제어/타겟이 아닌 게이트)
+        for col, ops in self.view.iter_by_column():
+            if col_starts is not None:
+                col_starts.append((col, len(stream)))
+            ctrls, xt, zt, meas = [], [], [], []
+
+            # A. 단일 큐비트 게이트는 바로 추가, 나머지는 종류별로 분류
             for g in ops:
-                if g.gate_type=="H": qc.h(g.row)
-                elif g.gate_type=="X": qc.x(g.row)
-                elif g.gate_type=="Y": qc.y(g.row)
-                elif g.gate_type=="Z": qc.z(g.row)
-                # 회전 게이트: g.angle을 사용 (None인 경우 0으로 처리)
-                elif g.gate_type=="RX": qc.rx(g.angle if g.angle is not None else 0, g.row)
-                elif g.gate_type=="RY": qc.ry(g.angle if g.angle is not None else 0, g.row)
-                elif g.gate_type=="RZ": qc.rz(g.angle if g.angle is not None else 0, g.row)
-            
-            # B. 다중 큐비트 게이트 (Control, Target)
-            ctrls = [g.row for g in ops if g.gate_type=="CTRL"]
-            xt = [g.row for g in ops if g.gate_type=="X_T"]
-            zt = [g.row for g in ops if g.gate_type=="Z_T"]
+                t = g.gate_type
+                if t in _SINGLE_GATES:
+                    emit(CircuitInstruction(_SINGLE_GATES[t], (qubits[g.row],)))
+                elif t in _ROTATION_GATES:
+                    # 회전 게이트: g.angle을 사용 (None인 경우 0으로 처리)
+                    angle = g.angle if g.angle is not None else 0
+                    if params is not None:
+                        angle = Parameter(f"θ{len(params)}")
+                        params.append(angle)
+                    gate = _ROTATION_GATES[t](angle)
+                    emit(CircuitInstruction(gate, (qubits[g.row],)))
+                elif t == "CTRL":
+                    ctrls.append(g.row)
+                elif t == "X_T":
+                    xt.append(g.row)
+                elif t == "Z_T":
+                    zt.append(g.row)
+                elif t == "MEASURE":
+                    meas.append(g.row)
 
+            # B. 다중 큐비트 게이트 (Control, Target)
             # CNOT / MCX
             if len(xt)==1:
                 t = xt[0]
-                if len(ctrls)==0: qc.x(t)      # T-gate가 단독이면 X 게이트
-                elif len(ctrls)==1: qc.cx(ctrls[0], t) # CNOT
-                else: qc.mcx(ctrls, t)         # Toffoli / MCX
+                if len(ctrls)==0: gate = _SINGLE_GATES["X"]       # T-gate가 단독이면 X 게이트
+                elif len(ctrls)==1: gate = _CX_GATE               # CNOT
+                else: gate = _mcx_gate(len(ctrls))                # Toffoli / MCX
+                emit(CircuitInstruction(gate, tuple(qubits[r] for r in ctrls + [t])))
 
             # CZ / MCZ
             if len(zt)==1:
                 t = zt[0]
-                if len(ctrls)==0: qc.z(t)      # T-gate가 단독이면 Z 게이트
-                elif len(ctrls)==1: qc.cz(ctrls[0], t) # CZ
-                else: qc.mcz(ctrls, t)         # MCZ
-            
+                if len(ctrls)==0: gate = _SINGLE_GATES["Z"]       # T-gate가 단독이면 Z 게이트
+                elif len(ctrls)==1: gate = _CZ_GATE               # CZ
+                else: gate = _mcz_gate(len(ctrls))                # MCZ
+                emit(CircuitInstruction(gate, tuple(qubits[r] for r in ctrls + [t])))
+
             # C. 측정 게이트
-            for g in ops:
-                if g.gate_type=="MEASURE":
-                    qc.measure(g.row, g.row)
+            for r in meas:
+                emit(CircuitInstruction(_MEASURE, (qubits[r],), (clbits[r],)))
+
+        # 공개 API로 추가해 개수/인자 검증은 그대로 받고, copy=False로 게이트 복사만 생략
+        # (공유 게이트 객체는 회로에 넣은 뒤 수정하지 않으므로 복사할 필요가 없음)
+        append = qc.append
+        for inst in stream:
+            append(inst, copy=False)
 
         return qc
 
@@ -1252,52 +1998,28 @@ class ComposerTab(QWidget):
     # -----------------------------------------------------
     
     def export_qiskit(self):
+        # build_qiskit_circuit으로 만든 회로를 한 번 순회하며 코드로 변환
+        col_starts: List[Tuple[int, int]] = []
         try:
-            infos = self.view.export_gate_infos()
+            qc = self.build_qiskit_circuit(col_starts=col_starts)
         except Exception as e:
             QMessageBox.warning(self,"Export Error",f"Failed to get gate info: {e}")
             return
 
-        code = []
-        code.append("from qiskit import QuantumCircuit\n")
-        code.append(f"qc = QuantumCircuit({self.view.n_qubits}, {self.view.n_qubits})\n\n")
-
-        # 게이트 정보가 이미 정렬되어 있으므로, build_qiskit_circuit 로직을 코드 출력에 적용
-        bycol = {}
-        for g in infos:
-            bycol.setdefault(g.col,[]).append(g)
-
-        for col in sorted(bycol):
-            ops = bycol[col]
-            code.append(f"\n# Column {col}\n")
-            
-            # 단일 큐비트
-            for g in ops:
-                if g.gate_type=="H": code.append(f"qc.h({g.row})\n")
-                elif g.gate_type=="X": code.append(f"qc.x({g.row})\n")
-                elif g.gate_type=="Y": code.append(f"qc.y({g.row})\n")
-                elif g.gate_type=="Z": code.append(f"qc.z({g.row})\n")
-                elif g.gate_type=="RX": code.append(f"qc.rx({g.angle if g.angle is not None else 0}, {g.row})\n")
-                elif g.gate_type=="RY": code.append(f"qc.ry({g.angle if g.angle is not None else 0}, {g.row})\n")
-                elif g.gate_type=="RZ": code.append(f"qc.rz({g.angle if g.angle is not None else 0}, {g.row})\n")
-                elif g.gate_type=="MEASURE": code.append(f"qc.measure({g.row}, {g.row})\n")
-            
-            # 다중 큐비트
-            ctrls = [g.row for g in ops if g.gate_type=="CTRL"]
-            xt = [g.row for g in ops if g.gate_type=="X_T"]
-            zt = [g.row for g in ops if g.gate_type=="Z_T"]
-
-            if len(xt)==1:
-                t = xt[0]
-                if len(ctrls)==0: code.append(f"qc.x({t}) # T-gate without controls\n")
-                elif len(ctrls)==1: code.append(f"qc.cx({ctrls[0]}, {t})\n")
-                else: code.append(f"qc.mcx({ctrls}, {t})\n")
+        n = self.view.n_qubits
+        code = [
+            "from qiskit import QuantumCircuit\n",
+            f"qc = QuantumCircuit({n}, {n})\n\n",
+        ]
+        append = code.append
+        index = {q: i for i, q in enumerate(qc.qubits)}
+        data = qc.data
+        ends = [start for _, start in col_starts[1:]] + [len(data)]
 
-            if len(zt)==1:
-                t = zt[0]
-                if len(ctrls)==0: code.append(f"qc.z({t}) # T-gate without controls\n")
-                elif len(ctrls)==1: code.append(f"qc.cz({ctrls[0]}, {t})\n")
-                else: code.append(f"qc.mcz({ctrls}, {t})\n")
+        for (col, start), end in zip(col_starts, ends):
+            append(f"\n# Column {col}\n")
+            for inst in data[start:end]:
+                append(_qiskit_code_line(inst.operation, [index[q] for q in inst.qubits]))
 
         code_str = "".join(code)
 
@@ -1306,12 +2028,13 @@ class ComposerTab(QWidget):
         lay = QVBoxLayout(dlg)
         box = QTextEdit()
         box.setReadOnly(True)
-        box.setText(code_str)
+        # 코드 문자열이므로 리치 텍스트 판별/파싱 없이 그대로 표시
+        box.setPlainText(code_str)
         lay.addWidget(box)
 
         btn = QPushButton("Copy to Clipboard")
         lay.addWidget(btn)
-        btn.clicked.connect(lambda: QApplication.clipboard().setText(code_str))
+        btn.clicked.connect(lambda _=False, text=code_str: QApplication.clipboard().setText(text))
         dlg.resize(600,450)
         dlg.exec()
 
@@ -1321,8 +2044,13 @@ class ComposerTab(QWidget):
 
     def run_measurement(self):
         """
-        회로를 빌드하고 AerSimulator를 사용하여 측정을 실행합니다.
+        회로를 빌드하고 측정을 실행합니다.
+        측정이 모두 끝에 있으면 상태 벡터에서 샘플링하고, 아니면 AerSimulator를 사용합니다.
         """
+        # 이전 측정이 아직 실행 중이면 무시
+        if self._measure_running:
+            return
+
         try:
             infos = self.view.export_gate_infos()
         except Exception as e:
@@ -1341,23 +2069,101 @@ class ComposerTab(QWidget):
             return
         
         n_measured = len(measured_qubits)
-        
-        try:
-            qc = self.build_qiskit_circuit()
-        except Exception as e:
-            QMessageBox.warning(self,"Circuit Build Error",f"{e}")
-            return
 
-        try:
-            # AerSimulator는 Qiskit Aer에서 import 되어야 함
-            sim = AerSimulator()
-            shots = 1024
-            res = sim.run(qc, shots=shots).result()
-            counts = res.get_counts()
-        except Exception as e:
-            QMessageBox.warning(self,"Simulator Error",f"{e}")
+        # 측정이 모두 회로 끝에 있으면 상태 벡터에서 바로 샘플링 (Aer 실행 생략)
+        counts = self._sample_terminal_measurements(infos, measured_qubits, 1024)
+        if counts is not None:
+            self._show_measurement_result(counts, 1024)
             return
 
+        # 같은 게이트 구조(각도 제외)면 이전에 transpile한 템플릿에 각도만 다시 대입
+        key = (self.view.n_qubits,
+               tuple((g.gate_type, g.row, g.col) for g in infos))
+        angles = [g.angle for g in infos if g.gate_type in _ROTATION_GATES]
+        template = self._transpile_cache.get(key)
+        qc, params = None, []
+        if template is None:
+            try:
+                qc = self.build_qiskit_circuit(params=params)
+            except Exception as e:
+                QMessageBox.warning(self,"Circuit Build Error",f"{e}")
+                return
+
+        # 시뮬레이션은 스레드 풀에서 실행하고, 결과는 시그널로 받음
+        self._measure_running = True
+        self.btn_measure.setEnabled(False)
+        self._measure_n_measured = n_measured
+
+        if self._sim is None:
+            # 시뮬레이션 방식을 고정해 매 실행마다 방식 선택을 하지 않도록 함
+            self._sim = _new_simulator(method="statevector")
+            # CUDA 빌드(qiskit-aer-gpu)면 GPU 사용, 아니면 CPU 그대로
+            if "GPU" in self._sim.available_devices():
+                self._sim.set_options(device="GPU")
+        worker = SimWorker(qc, self._sim, shots=1024, key=key,
+                           params=params, template=template, angles=angles)
+        worker.signals.compiled.connect(self._store_transpiled)
+        worker.signals.finished.connect(self._on_measurement_finished)
+        worker.signals.failed.connect(self._on_measurement_failed)
+
+        # 실행 중 GC로 사라지지 않도록 참조 유지 (스레드는 풀에서 재사용)
+        self._sim_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _sample_terminal_measurements(self, infos, measured_qubits, shots):
+        """측정 뒤에 같은 큐비트에 게이트가 없으면 |ψ|²에서 shots번 샘플링한 counts를 반환
+
+        counts는 _on_measurement_finished가 걸러낸 뒤와 같은 표시용 형식.
+        중간 측정이 있으면 None (AerSimulator로 실행해야 함).
+        """
+        # 1. 큐비트마다 첫 측정 열이 그 큐비트의 다른 게이트보다 뒤에 있는지 확인
+        first_measure = {}
+        for g in infos:
+            if g.gate_type == "MEASURE":
+                first_measure[g.row] = min(g.col, first_measure.get(g.row, g.col))
+        for g in infos:
+            if g.gate_type != "MEASURE" and g.col > first_measure.get(g.row, g.col):
+                return None
+
+        # 2. 결과 표시는 오른쪽 len(measured_qubits)개 고전 비트(c[0]…)만 쓰므로
+        #    그 범위에서 측정한 큐비트만 남기고 나머지 축은 합해서 주변 확률분포를 구함
+        #    (큐비트 q는 축 n-1-q이므로 남은 축을 펼치면 인덱스의 i번째 비트가 shown[i])
+        n = self.view.n_qubits
+        k = len(measured_qubits)
+        shown = [q for q in sorted(measured_qubits) if q < k]
+        probs = np.abs(self._evolved_state()).astype(np.float64) ** 2
+        others = tuple(n - 1 - q for q in range(n) if q not in shown)
+        probs = probs.reshape((2,) * n).sum(axis=others).reshape(-1)
+        hits = np.random.default_rng().multinomial(shots, probs / probs.sum())
+
+        # 3. 표시 형식(k비트, 측정하지 않은 고전 비트는 0)의 counts로 바로 변환
+        counts = {}
+        for idx in np.flatnonzero(hits):
+            bits = ["0"] * k
+            for i, q in enumerate(shown):
+                if (idx >> i) & 1:
+                    bits[k - 1 - q] = "1"
+            counts["".join(bits)] = int(hits[idx])
+        return counts
+
+    def _store_transpiled(self, key, template):
+        if len(self._transpile_cache) >= TRANSPILE_CACHE_SIZE:
+            self._transpile_cache.pop(next(iter(self._transpile_cache)))
+        self._transpile_cache[key] = template
+
+    def _measurement_done(self):
+        self._measure_running = False
+        self.btn_measure.setEnabled(True)
+        self._sim_worker = None
+
+    def _on_measurement_failed(self, message):
+        self._measurement_done()
+        QMessageBox.warning(self,"Simulator Error",message)
+
+    def _on_measurement_finished(self, counts, shots):
+        self._measurement_done()
+        n_measured = self._measure_n_measured
+
         # 측정된 비트 개수가 전체보다 적으면 결과 필터링
         if n_measured < self.view.n_qubits:
             filtered_counts = {}
@@ -1368,6 +2174,9 @@ class ComposerTab(QWidget):
                 filtered_counts[truncated] = filtered_counts.get(truncated, 0) + count
             counts = filtered_counts
 
+        self._show_measurement_result(counts, shots)
+
+    def _show_measurement_result(self, counts, shots):
         # 측정 결과를 보기 좋게 포맷팅
         result_lines = [
             "═" * 60,
@@ -1380,14 +2189,14 @@ class ComposerTab(QWidget):
             "─" * 60
         ]
         
-        # 결과를 확률 순서로 정렬
+        # 결과를 확률 순서로 정렬 (백분율 환산 계수는 한 번만 계산)
         sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-        for bitstring, count in sorted_counts:
+        scale = 100.0 / shots
+        result_lines.extend(
             # bitstring에서 공백 제거
-            clean_bitstring = bitstring.replace(" ", "")
-            percentage = (count / shots) * 100
-            result_lines.append(f"|{clean_bitstring}⟩: {count:4d}회 ({percentage:6.2f}%)")
-        
+            f"|{bitstring.replace(' ', '')}⟩: {count:4d}회 ({count * scale:6.2f}%)"
+            for bitstring, count in sorted_counts
+        )
         result_lines.append("═" * 60)
         result_text = "\n".join(result_lines)
 
@@ -1489,12 +2298,15 @@ class TutorialTab(QWidget):
 
         root = QHBoxLayout(self)
 
-        self.tutorials: List[Tutorial] = self.build_tutorials()
+        self.tutorials: Tuple[Tutorial, ...] = _TUTORIALS
         self.current_tutorial: Tutorial | None = None
         self.current_step_index: int = 0
 
         self.tutorials_started = False  # ★ 추가: 스타트 버튼 누름 여부
 
+        # AerSimulator는 처음 측정할 때 한 번 만들고 탭이 살아 있는 동안 재사용
+        self._sim: Optional[AerSimulator] = None
+
         # ======================================================
         # LEFT : Tutorial List (1/4)
         # ======================================================
@@ -1519,6 +2331,8 @@ class TutorialTab(QWidget):
 
         self.intro_text = QTextEdit()
         self.intro_text.setReadOnly(True)
+        # theory_key별 QTextDocument 캐시 (문서 레이아웃은 튜토리얼마다 한 번만)
+        self._theory_docs: Dict[str, QTextDocument] = {}
         self.intro_text.setText(
             "왼쪽에서 튜토리얼을 선택한 뒤,\n"
             "Next 버튼을 눌러 실습을 시작하세요.\n\n"
@@ -1534,6 +2348,32 @@ class TutorialTab(QWidget):
         self.stack.addWidget(self.page_intro)
 
         # ---- Page 1 : Interactive Step ----
+        # 회로/팔레트 scene이 있는 Step 페이지는 처음 start_tutorial 할 때 _build_step_page에서 생성
+        self.page_step: Optional[QWidget] = None
+
+
+        # ======================================================
+        # Signals
+        # ======================================================
+        self.btn_start.clicked.connect(self.start_tutorial)
+        self.list_widget.currentRowChanged.connect(self.on_tutorial_selected)
+
+        self.stack.setCurrentIndex(0)
+
+        #Deutsch-Josza 용 오라클 함수 저장 변수
+        self.oracle_truth_table: dict[str, int] | None = None
+        self.oracle_type : str | None = None  # "constant" or "balanced"
+
+        # Superdense Coding 선택 메시지 ("00","01","10","11")
+        self.superdense_message: str | None = None
+
+
+        
+
+        # When selecting tutorial, update description
+
+    def _build_step_page(self):
+        """Step 페이지(Page 1)를 만들어 stack에 추가 - 튜토리얼을 처음 시작할 때 한 번만 호출"""
         self.page_step = QWidget()
         step_layout = QVBoxLayout(self.page_step)
         # 레이아웃 여백 설정으로 중앙 정렬 및 짤림 방지
@@ -1564,15 +2404,13 @@ class TutorialTab(QWidget):
         step_layout.addSpacing(10)
 
         circuit_box = QHBoxLayout()
-        self.view = CircuitView()
-        self.palette = PaletteView(self.view)
         # 스크롤 없이도 모두 보이도록 고정 높이로 조정 (튜토리얼 전용)
-        CIRCUIT_HEIGHT = 500
-
-        self.view.setFixedHeight(CIRCUIT_HEIGHT)
-        self.palette.setFixedHeight(CIRCUIT_HEIGHT)
         # 튜토리얼에서는 scene 크기도 고정하여 큐비트 수와 무관하게 일관된 높이 유지
-        self.view.setSceneRect(0, 0, self.view.get_right_end() + 200, CIRCUIT_HEIGHT)
+        self.view = CircuitView(CircuitViewCfg(scene_height=TUTORIAL_CIRCUIT_HEIGHT))
+        self.palette = PaletteView(self.view)
+
+        self.view.setFixedHeight(TUTORIAL_CIRCUIT_HEIGHT)
+        self.palette.setFixedHeight(TUTORIAL_CIRCUIT_HEIGHT)
 
         from PyQt6.QtWidgets import QSizePolicy
         # 수직 확장을 막아 과도한 높이 점유 방지
@@ -1665,31 +2503,12 @@ class TutorialTab(QWidget):
 
         self.stack.addWidget(self.page_step)
 
-        # ======================================================
-        # Signals
-        # ======================================================
-        self.btn_start.clicked.connect(self.start_tutorial)
         self.btn_measure_tutorial.clicked.connect(self.run_measurement_tutorial)
         self.btn_check.clicked.connect(self.check_step)
         self.btn_hint.clicked.connect(self.show_hint)
         self.btn_next.clicked.connect(self.next_step)
         self.btn_back_intro.clicked.connect(self.go_to_intro)
         self.btn_reset.clicked.connect(self.reset_step)
-        self.list_widget.currentRowChanged.connect(self.on_tutorial_selected)
-
-        self.stack.setCurrentIndex(0)
-
-        #Deutsch-Josza 용 오라클 함수 저장 변수
-        self.oracle_truth_table: dict[str, int] | None = None
-        self.oracle_type : str | None = None  # "constant" or "balanced"
-
-        # Superdense Coding 선택 메시지 ("00","01","10","11")
-        self.superdense_message: str | None = None
-
-
-        
-
-        # When selecting tutorial, update description
 
     def on_tutorial_selected(self, row: int):
         if row < 0:
@@ -1717,21 +2536,36 @@ class TutorialTab(QWidget):
         self.current_tutorial = selected_tutorial
         self.current_step_index = 0
 
-        # 진행률 초기화
-        self.progress.setValue(0)
+        # 진행률 초기화 (Step 페이지가 아직 없으면 새로 만들 때 초기 상태이므로 생략)
+        if self.page_step is not None:
+            self.progress.setValue(0)
             # NEXT 버튼 활성화
-        self.btn_next.setEnabled(True)
+            self.btn_next.setEnabled(True)
 
         if not self.tutorials_started:
             # ★ 튜토리얼 시작 전: Intro 페이지 표시
-            theory_key = self.current_tutorial.theory_key
-            self.intro_title.setText(self.current_tutorial.name)
-            self.intro_text.setText(self.TUTORIAL_DATA.get(theory_key, "이 튜토리얼에 대한 정보가 없습니다."))
+            self.display_tutorial(self.current_tutorial)
             self.stack.setCurrentIndex(0)
         else:
             # ★ 튜토리얼 시작 후: Step 페이지 바로 로드
             self.start_tutorial()
 
+    def display_tutorial(self, tutorial: Tutorial):
+        """Intro 페이지에 튜토리얼 이름과 이론 설명 표시"""
+        self.intro_title.setText(tutorial.name)
+        self.intro_text.setDocument(self._theory_doc(tutorial.theory_key))
+
+    def _theory_doc(self, key: str) -> QTextDocument:
+        """이론 설명 문서를 처음 선택될 때 한 번 만들고 이후엔 재사용"""
+        doc = self._theory_docs.get(key)
+        if doc is None:
+            # parent를 self로 두어 문서를 바꿔 끼워도 삭제되지 않게 함
+            doc = QTextDocument(self)
+            doc.setDefaultFont(self.intro_text.font())
+            doc.setPlainText(self.TUTORIAL_DATA.get(key, "이 튜토리얼에 대한 정보가 없습니다."))
+            self._theory_docs[key] = doc
+        return doc
+
     def open_oracle_dialog(self):
         dialog = QDialog(self.window())
         dialog.setWindowTitle("Define Oracle f(x)")
@@ -1858,320 +2692,12 @@ class TutorialTab(QWidget):
 
 
 
-    # --------------------------------------------------------
-    # Tutorial Construction
-    # --------------------------------------------------------
-    def build_tutorials(self) -> List[Tutorial]:
-        # -----------------------------
-        # Hadamard Gate Tutorial
-        # -----------------------------
-        hadamard_steps = [
-
-            # 1️⃣ |0⟩ 상태 확인
-            TutorialStep(
-                title="기본 상태 |0⟩",
-                instruction="아무 게이트도 배치하지 말고 회로를 확인하세요.",
-                expected=lambda infos: len(infos) == 0,
-                hint="초기 상태는 |0⟩입니다."
-            ),
-
-            # 2️⃣ 단일 Hadamard
-            TutorialStep(
-                title="중첩 상태 만들기",
-                instruction="q[0]에 Hadamard 게이트를 하나 배치하세요.",
-                expected=lambda infos: (
-                    len(infos) == 1 and
-                    infos[0].gate_type == 'H' and
-                    infos[0].row == 0
-                ),
-                hint="H(q0)는 |0⟩을 중첩 상태로 만듭니다."
-            ),
-
-            # 3️⃣ 가역성
-            TutorialStep(
-                title="Hadamard는 가역적이다",
-                instruction="q[0]에 Hadamard 게이트를 두 번 배치한 후, M(측정) 게이트를 q[0]에 배치하세요.",
-                expected=lambda infos: (
-                    sum(1 for g in infos if g.gate_type == 'H' and g.row == 0) == 2 and
-                    any(g.gate_type == 'MEASURE' and g.row == 0 for g in infos)
-                ),
-                hint="같은 큐비트에 H를 두 번 연속 배치한 후 M 게이트를 놓으세요."
-            ),
-        ]
-
-        # -----------------------------
-        # CNOT Tutorial
-        # -----------------------------
-        cnot_steps = [
-
-            # 1️⃣ 고전적 준비
-            TutorialStep(
-                title="제어 비트 준비",
-                instruction="q[0]에 X 게이트를 배치하세요.",
-                expected=lambda infos: (
-                    len(infos) == 1 and
-                    infos[0].gate_type == 'X' and
-                    infos[0].row == 0
-                ),
-                hint="제어 큐비트를 |1⟩로 만듭니다."
-            ),
-
-            # 2️⃣ 고전적 상관관계
-            TutorialStep(
-                title="고전적 상관관계",
-                instruction="q[0] → q[1] 방향으로 CNOT을 구성하세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'CTRL' and g.row == 0 for g in infos) and
-                    any(g.gate_type == 'X_T' and g.row == 1 for g in infos)
-                ),
-                hint="CNOT은 제어가 핵심입니다."
-            ),
-
-            # 3️⃣ Bell 상태 준비
-            TutorialStep(
-                title="Bell 상태 만들기",
-                instruction="X 대신 Hadamard로 Bell 상태를 만드세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'H' and g.row == 0 for g in infos) and
-                    any(g.gate_type == 'CTRL' and g.row == 0 for g in infos) and
-                    any(g.gate_type == 'X_T' and g.row == 1 for g in infos)
-                ),
-                hint="H(q0) → CNOT(q0→q1)"
-            ),
-
-            # 4️⃣ 순서 강제
-            TutorialStep(
-                title="순서가 바뀌면 얽힘이 아니다",
-                instruction="Hadamard가 먼저 와야 합니다.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'H' and g.row == 0 for g in infos) and
-                    any(g.gate_type == 'CTRL' and g.row == 0 for g in infos)
-                ),
-                hint="연산은 교환되지 않습니다."
-            ),
-
-            # 5️⃣ 제어/타겟 비대칭성
-            TutorialStep(
-                title="CNOT은 대칭이 아니다",
-                instruction="제어와 타겟을 바꿔보세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'CTRL' and g.row == 1 for g in infos) and
-                    any(g.gate_type == 'X_T' and g.row == 0 for g in infos)
-                ),
-                hint="얽힘은 방향성을 가집니다."
-            ),
-        ]
-
-        # -----------------------------
-        # QFT Tutorial (Skeleton)
-        # -----------------------------
-        qft_steps = [
-            TutorialStep(
-                title="QFT의 시작",
-                instruction="q[0]에 Hadamard 게이트를 배치하세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'H' and g.row == 0 for g in infos)
-                ),
-                hint="QFT는 각 큐비트에 대한 Fourier 변환으로 시작합니다."
-            ),
+    def _simulator(self) -> AerSimulator:
+        """튜토리얼 측정에 쓰는 AerSimulator (처음 호출할 때 한 번만 생성)"""
+        if self._sim is None:
+            self._sim = _new_simulator()
+        return self._sim
 
-            TutorialStep(
-                title="제어 위상 연산",
-                instruction="q[0]이 q[1]에 위상을 주도록 제어 게이트를 추가하세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'CTRL' and g.row == 0 for g in infos)
-                ),
-                hint="위상 정보는 다른 큐비트와의 관계로 저장됩니다."
-            ),
-            
-            TutorialStep(
-                title="두 번째 Hadamard",
-                instruction="q[1]에 Hadamard 게이트를 배치하세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'H' and g.row == 1 for g in infos)
-                ),
-                hint="각 큐비트는 자신의 Fourier 변환을 가집니다."
-            ),
-            
-            TutorialStep(
-                title="순서의 중요성",
-                instruction="Hadamard → 제어 위상 → Hadamard 순서를 유지하세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'H' and g.row == 0 for g in infos) and
-                    any(g.gate_type == 'CTRL' for g in infos) and
-                    any(g.gate_type == 'H' and g.row == 1 for g in infos)
-                ),
-                hint="연산 순서가 바뀌면 Fourier 변환이 아닙니다."
-            ),
-            
-            TutorialStep(
-                title="출력 비트 순서",
-                instruction="QFT의 출력 순서가 입력과 반대임을 확인하세요.",
-                expected=lambda infos: (
-                    len(infos) >= 3  # 아직 SWAP 미구현 → 개념 확인 단계
-                ),
-                hint="QFT 결과는 비트 순서가 뒤집혀 나타납니다."
-            ),
-
-            TutorialStep(
-                title="QFT는 가역적이다",
-                instruction="QFT 뒤에 역연산을 구성하고, 측정(M) 게이트를 q[0]에 배치하세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'MEASURE' and g.row == 0 for g in infos)
-                ),
-                hint="모든 양자 게이트는 되돌릴 수 있습니다. 측정 게이트를 추가해주세요."
-            ),
-        ]
-
-        # -----------------------------
-        # Superdense Coding Tutorial
-        # -----------------------------
-        superdense_steps = [
-            TutorialStep(
-                title="Bell Pair 준비",
-                instruction="Alice와 Bob이 공유할 Bell 상태를 준비하세요.",
-                expected=lambda infos: (
-                    any(g.gate_type == 'H' for g in infos) and
-                    any(g.gate_type == 'CTRL' for g in infos)
-                ),
-                hint="H(q0) → CNOT(q0→q1)"
-            ),
-
-            TutorialStep(
-                title="메시지 선택",
-                instruction=(
-                    "앨리스가 보낼 메시지를 선택하세요.\n"
-                    "우측 'Choose Message' 버튼을 눌러 00, 01, 10, 11 중 하나를 선택하세요."
-                ),
-                expected=lambda infos: True,
-                hint="'Choose Message' 버튼으로 메시지를 먼저 선택하세요."
-            ),
-
-            TutorialStep(
-                title="Alice의 인코딩",
-                instruction=(
-                    "보내고 싶은 메시지에 해당되는 게이트를 앨리스의 큐비트 q[0]에 적용하세요."
-                ),
-                expected=lambda infos: True,
-                hint="Hint를 누르면 적용해야 하는 게이트(I, X, Z, XZ 또는 Y)를 알려드립니다."
-            ),
-
-            TutorialStep(
-                title="Bob의 디코딩 및 검증",
-                instruction=(
-                    "Bob의 디코딩 회로를 완성하고 q[0], q[1]에 M(측정) 게이트를 배치하세요.\n"
-                    "Check를 누르면 측정 결과가 선택한 메시지와 일치하는지 확인합니다."
-                ),
-                expected=lambda infos: (
-                    any(g.gate_type == 'CTRL' for g in infos) and
-                    any(g.gate_type == 'H' for g in infos) and
-                    any(g.gate_type == 'MEASURE' and g.row == 0 for g in infos) and
-                    any(g.gate_type == 'MEASURE' and g.row == 1 for g in infos)
-                ),
-                hint="CNOT 후 Hadamard, 그리고 두 큐비트 모두 측정합니다."
-            )
-
-        ]
-
-        deutsch_jozsa_steps = [
-            TutorialStep(
-                title="초기 상태 |0⟩|0⟩|1⟩ 만들기",
-                instruction=(
-                    "Deutsch–Jozsa 알고리즘은 |0⟩|0⟩|1⟩ 상태에서 시작합니다.\n"
-                    "출력 큐비트 q[2]에 X 게이트를 배치하세요."
-                ),
-                expected=lambda infos: any(g.gate_type == "X" and g.row == 2 for g in infos),
-                hint="q[2]에 X 게이트를 놓으세요."
-            ),
-
-            TutorialStep(
-                title="모든 큐비트에 Hadamard 적용",
-                instruction=(
-                    "모든 큐비트에 Hadamard 게이트를 적용합니다.\n"
-                    "q[0], q[1], q[2]에 각각 Hadamard 게이트를 배치하세요.\n"
-                    "(출력 큐비트 q[2]의 H는 위상 킥백에 필수입니다)"
-                ),
-                expected=lambda infos: (
-                    any(g.gate_type == "X" and g.row == 2 for g in infos) and
-                    any(g.gate_type == "H" and g.row == 0 for g in infos) and
-                    any(g.gate_type == "H" and g.row == 1 for g in infos) and
-                    any(g.gate_type == "H" and g.row == 2 for g in infos)
-                ),
-                hint="q[0], q[1], q[2] 세 큐비트 모두에 H 게이트를 놓으세요."
-            ),
-
-            TutorialStep(
-                title="Oracle 정의하기",
-                instruction=(
-                    "숨겨진 함수 f(x)를 정의합니다.\n\n"
-                    "• constant / balanced 중 선택\n"
-                    "• constant: 출력이 항상 0 또는 1\n"
-                    "• balanced: 00,01,10,11 중 두 개만 1\n\n"
-                    "Define Oracle 버튼을 눌러 정의하세요."
-                ),
-                expected=lambda infos: True,  # check_step에서 특별 처리
-                hint="Define Oracle 버튼을 눌러 constant 또는 balanced를 선택하세요.",
-                #auto_setup=lambda view: self.open_oracle_dialog()
-            ),
-            TutorialStep(
-                title="오라클 뒤 입력 큐비트에 Hadamard 적용",
-                instruction=(
-                    "Oracle을 적용한 뒤 입력 큐비트 q[0], q[1]에 Hadamard 게이트를 배치하세요."
-                ),
-                expected=lambda infos: (
-                    sum(1 for g in infos if g.gate_type == "H" and g.row == 0) >= 2 and
-                    sum(1 for g in infos if g.gate_type == "H" and g.row == 1) >= 2
-                ),
-                hint="q[0]과 q[1] 두 입력 큐비트에 H를 한 번 더 적용합니다."
-            ),
-            TutorialStep(
-                title="입력 큐비트 측정 및 판별",
-                instruction=(
-                    "모든 입력 큐비트 q[0], q[1]에 측정(M) 게이트를 배치하세요.\n\n"
-                    "예상 결과:\n"
-                    "• constant → 측정 결과가 모두 |00⟩\n"
-                    "• balanced → 측정 결과에 |00⟩이 없음 (|01⟩, |10⟩, |11⟩ 중 하나)\n\n"
-                    "M 게이트 배치 후 Check를 눌러 판별합니다."
-                ),
-                expected=lambda infos: (
-                    any(g.gate_type == "MEASURE" and g.row == 0 for g in infos) and
-                    any(g.gate_type == "MEASURE" and g.row == 1 for g in infos)
-                ),
-                hint="q[0]과 q[1] 두 입력 큐비트에 M(측정) 게이트를 놓으세요."
-            ),
-
-
-
-
-        ]
-
-        return [
-            Tutorial(
-                name="Hadamard Gate",
-                theory_key="1. Qubit과 Hadamard Gate",
-                steps=hadamard_steps
-            ),
-            Tutorial(
-                name="CNOT Gate",
-                theory_key="2. CNOT과 Entanglement",
-                steps=cnot_steps
-            ),
-            Tutorial(
-                name="Quantum Fourier Transform",
-                theory_key="3. 양자 푸리에 변환 (QFT) 기초",
-                steps=qft_steps
-            ),
-            Tutorial(
-                name="Superdense Coding",
-                theory_key="4. 초고밀도 코딩 (Superdense Coding)",
-                steps=superdense_steps
-            ),
-            Tutorial(
-                name="Deutsch Jozsa Algorithm",
-                theory_key="5. Deutsch Jozsa Algorithm",
-                steps=deutsch_jozsa_steps
-            )
-        ]
     # --------------------------------------------------------
     # Flow Control
     # --------------------------------------------------------
@@ -2180,6 +2706,9 @@ class TutorialTab(QWidget):
             QMessageBox.warning(self, "Select", "튜토리얼을 선택하세요.")
             return
 
+        if self.page_step is None:
+            self._build_step_page()
+
         # 튜토리얼 시작 플래그 설정
         self.tutorials_started = True
 
@@ -2188,7 +2717,7 @@ class TutorialTab(QWidget):
         if required is not None:
             self.view.n_qubits = max(1, min(required, MAX_QUBITS))
             # 튜토리얼에서는 scene rect를 고정값으로 유지 (일관된 레이아웃)
-            self.view.setSceneRect(0, 0, self.view.get_right_end() + 200, 500)
+            self.view._update_scene_rect()
             self.view.clear_circuit(remove_oracle=True)
             self.view.draw_all()
 
@@ -2280,9 +2809,8 @@ class TutorialTab(QWidget):
         ):
             try:
                 qc = QuantumCircuit(self.view.n_qubits, self.view.n_qubits)
-                bycol = {}
-                for g in infos:
-                    bycol.setdefault(g.col, []).append(g)
+                # 열 인덱스에서 바로 col -> [GateInfo] 묶음을 얻음 (열 순서대로 들어 있음)
+                bycol = dict(self.view.iter_by_column())
 
                 oracle_col = self.view.get_oracle_column()
                 
@@ -2291,68 +2819,24 @@ class TutorialTab(QWidget):
                 after_oracle = {col: ops for col, ops in bycol.items() if col > oracle_col}
                 
                 # 1. Oracle 이전 게이트들 처리
-                for col in sorted(before_oracle.keys()):
+                for col in before_oracle:
                     ops = before_oracle[col]
-                    for g in ops:
-                        if g.gate_type=="H": qc.h(g.row)
-                        elif g.gate_type=="X": qc.x(g.row)
-                        elif g.gate_type=="Y": qc.y(g.row)
-                        elif g.gate_type=="Z": qc.z(g.row)
-                        elif g.gate_type=="RX": qc.rx(g.angle if g.angle is not None else 0, g.row)
-                        elif g.gate_type=="RY": qc.ry(g.angle if g.angle is not None else 0, g.row)
-                        elif g.gate_type=="RZ": qc.rz(g.angle if g.angle is not None else 0, g.row)
-
-                    ctrls = [g.row for g in ops if g.gate_type=="CTRL"]
-                    xt = [g.row for g in ops if g.gate_type=="X_T"]
-                    zt = [g.row for g in ops if g.gate_type=="Z_T"]
-
-                    if len(xt)==1:
-                        t = xt[0]
-                        if len(ctrls)==0: qc.x(t)
-                        elif len(ctrls)==1: qc.cx(ctrls[0], t)
-                        else: qc.mcx(ctrls, t)
-
-                    if len(zt)==1:
-                        t = zt[0]
-                        if len(ctrls)==0: qc.z(t)
-                        elif len(ctrls)==1: qc.cz(ctrls[0], t)
-                        else: qc.mcz(ctrls, t)
+                    _apply_column(qc, ops)
 
                 # 2. Oracle 적용
                 self.apply_oracle_to_qc(qc)
 
                 # 3. Oracle 이후 게이트들 처리
-                for col in sorted(after_oracle.keys()):
+                for col in after_oracle:
                     ops = after_oracle[col]
-                    for g in ops:
-                        if g.gate_type=="H": qc.h(g.row)
-                        elif g.gate_type=="X": qc.x(g.row)
-                        elif g.gate_type=="Y": qc.y(g.row)
-                        elif g.gate_type=="Z": qc.z(g.row)
-                        elif g.gate_type=="RX": qc.rx(g.angle if g.angle is not None else 0, g.row)
-                        elif g.gate_type=="RY": qc.ry(g.angle if g.angle is not None else 0, g.row)
-                        elif g.gate_type=="RZ": qc.rz(g.angle if g.angle is not None else 0, g.row)
-
-                    ctrls = [g.row for g in ops if g.gate_type=="CTRL"]
-                    xt = [g.row for g in ops if g.gate_type=="X_T"]
-                    zt = [g.row for g in ops if g.gate_type=="Z_T"]
-
-                    if len(xt)==1:
-                        t = xt[0]
-                        if len(ctrls)==0: qc.x(t)
-                        elif len(ctrls)==1: qc.cx(ctrls[0], t)
-                        else: qc.mcx(ctrls, t)
-
-                    if len(zt)==1:
-                        t = zt[0]
-                        if len(ctrls)==0: qc.z(t)
-                        elif len(ctrls)==1: qc.cz(ctrls[0], t)
-                        else: qc.mcz(ctrls, t)
-
-                # 측정 게이트 추가
+                    _apply_column(qc, ops)
+
+                # 측정 게이트 추가 (측정한 큐비트도 같은 순회에서 기록)
+                measured_qubits = set()
                 for g in infos:
                     if g.gate_type == "MEASURE":
                         qc.measure(g.row, g.row)
+                        measured_qubits.add(g.row)
                 
                 # 측정 게이트가 없으면 추가
                 has_measure = any(inst.operation.name=="measure" for inst in qc.data)
@@ -2360,16 +2844,10 @@ class TutorialTab(QWidget):
                     qc.measure(0, 0)
 
                 shots = 512
-                sim = AerSimulator()
+                sim = self._simulator()
                 res = sim.run(qc, shots=shots).result()
                 counts = res.get_counts()
 
-                # 실제로 측정된 큐비트만 추출 (회로의 M 게이트 확인)
-                measured_qubits = set()
-                for g in infos:
-                    if g.gate_type == "MEASURE":
-                        measured_qubits.add(g.row)
-                
                 n_measured = len(measured_qubits)
                 
                 # 측정된 큐비트만 결과에 표시 (필터링)
@@ -2480,9 +2958,10 @@ class TutorialTab(QWidget):
                 return
 
             # q[0]에 적용된 X/Z/Y 게이트의 패리티 계산
-            x_count = sum(1 for g in infos if g.row == 0 and g.gate_type == 'X')
-            z_count = sum(1 for g in infos if g.row == 0 and g.gate_type == 'Z')
-            y_count = sum(1 for g in infos if g.row == 0 and g.gate_type == 'Y')
+            q0_counts = Counter(g.gate_type for g in infos if g.row == 0)
+            x_count = q0_counts['X']
+            z_count = q0_counts['Z']
+            y_count = q0_counts['Y']
             x_parity = x_count % 2
             z_parity = z_count % 2
             y_parity = y_count % 2
@@ -2538,42 +3017,14 @@ class TutorialTab(QWidget):
             try:
                 # 회로 구성 (오라클 없음): 컬럼 순서대로 게이트 적용
                 qc = QuantumCircuit(self.view.n_qubits, self.view.n_qubits)
-                bycol = {}
-                for g in infos:
-                    bycol.setdefault(g.col, []).append(g)
+                # 열 인덱스에서 바로 col -> [GateInfo] 묶음을 얻음 (열 순서대로 들어 있음)
+                bycol = dict(self.view.iter_by_column())
 
                 measured_qubits = set()
 
-                for col in sorted(bycol.keys()):
+                for col in bycol:
                     ops = bycol[col]
-                    # 1-qubit gates
-                    for g in ops:
-                        if g.gate_type=="H": qc.h(g.row)
-                        elif g.gate_type=="X": qc.x(g.row)
-                        elif g.gate_type=="Y": qc.y(g.row)
-                        elif g.gate_type=="Z": qc.z(g.row)
-                        elif g.gate_type=="RX": qc.rx(g.angle if g.angle is not None else 0, g.row)
-                        elif g.gate_type=="RY": qc.ry(g.angle if g.angle is not None else 0, g.row)
-                        elif g.gate_type=="RZ": qc.rz(g.angle if g.angle is not None else 0, g.row)
-                        elif g.gate_type=="MEASURE":
-                            measured_qubits.add(g.row)
-                            qc.measure(g.row, g.row)
-
-                    ctrls = [g.row for g in ops if g.gate_type=="CTRL"]
-                    xt = [g.row for g in ops if g.gate_type=="X_T"]
-                    zt = [g.row for g in ops if g.gate_type=="Z_T"]
-
-                    if len(xt)==1:
-                        t = xt[0]
-                        if len(ctrls)==0: qc.x(t)
-                        elif len(ctrls)==1: qc.cx(ctrls[0], t)
-                        else: qc.mcx(ctrls, t)
-
-                    if len(zt)==1:
-                        t = zt[0]
-                        if len(ctrls)==0: qc.z(t)
-                        elif len(ctrls)==1: qc.cz(ctrls[0], t)
-                        else: qc.mcz(ctrls, t)
+                    measured_qubits.update(_apply_column(qc, ops, measure=True))
 
                 # 측정 검증: 반드시 q[0], q[1] 모두 측정
                 if not ({0,1}.issubset(measured_qubits)):
@@ -2581,7 +3032,7 @@ class TutorialTab(QWidget):
                     return
 
                 shots = 512
-                sim = AerSimulator()
+                sim = self._simulator()
                 res = sim.run(qc, shots=shots).result()
                 counts = res.get_counts()
 
@@ -2627,7 +3078,7 @@ class TutorialTab(QWidget):
             if has_measure:
                 try:
                     qc = self.build_qiskit_circuit()
-                    sim = AerSimulator()
+                    sim = self._simulator()
                     shots = 1024
                     res = sim.run(qc, shots=shots).result()
                     counts = res.get_counts()
@@ -2767,13 +3218,11 @@ class TutorialTab(QWidget):
         """TutorialTab에서 현재 회로로 측정 실행"""
         try:
             # ComposerTab과 동일 로직: 회로 빌드
-            infos = self.view.export_gate_infos()
             # 클래식 레지스터는 아직 n_qubits로 초기화
             qc = QuantumCircuit(self.view.n_qubits, self.view.n_qubits)
 
-            bycol = {}
-            for g in infos:
-                bycol.setdefault(g.col, []).append(g)
+            # 열 인덱스에서 바로 col -> [GateInfo] 묶음을 얻음 (열 순서대로 들어 있음)
+            bycol = dict(self.view.iter_by_column())
 
             measured_qubits = set()  # 측정된 큐비트 추적
             oracle_col = self.view.get_oracle_column()  # Oracle이 배치될 열
@@ -2783,35 +3232,9 @@ class TutorialTab(QWidget):
             after_oracle = {col: ops for col, ops in bycol.items() if col > oracle_col}
             
             # 1. Oracle 이전 게이트들 처리
-            for col in sorted(before_oracle.keys()):
+            for col in before_oracle:
                 ops = before_oracle[col]
-                for g in ops:
-                    if g.gate_type=="H": qc.h(g.row)
-                    elif g.gate_type=="X": qc.x(g.row)
-                    elif g.gate_type=="Y": qc.y(g.row)
-                    elif g.gate_type=="Z": qc.z(g.row)
-                    elif g.gate_type=="RX": qc.rx(g.angle if g.angle is not None else 0, g.row)
-                    elif g.gate_type=="RY": qc.ry(g.angle if g.angle is not None else 0, g.row)
-                    elif g.gate_type=="RZ": qc.rz(g.angle if g.angle is not None else 0, g.row)
-                    elif g.gate_type == "MEASURE":
-                        measured_qubits.add(g.row)
-                        qc.measure(g.row, g.row)
-
-                ctrls = [g.row for g in ops if g.gate_type=="CTRL"]
-                xt = [g.row for g in ops if g.gate_type=="X_T"]
-                zt = [g.row for g in ops if g.gate_type=="Z_T"]
-
-                if len(xt)==1:
-                    t = xt[0]
-                    if len(ctrls)==0: qc.x(t)
-                    elif len(ctrls)==1: qc.cx(ctrls[0], t)
-                    else: qc.mcx(ctrls, t)
-
-                if len(zt)==1:
-                    t = zt[0]
-                    if len(ctrls)==0: qc.z(t)
-                    elif len(ctrls)==1: qc.cz(ctrls[0], t)
-                    else: qc.mcz(ctrls, t)
+                measured_qubits.update(_apply_column(qc, ops, measure=True))
             
             # 2. Oracle 적용 (DJ 튜토리얼인 경우만)
             if (self.current_tutorial and 
@@ -2819,35 +3242,9 @@ class TutorialTab(QWidget):
                 self.apply_oracle_to_qc(qc)
             
             # 3. Oracle 이후 게이트들 처리
-            for col in sorted(after_oracle.keys()):
+            for col in after_oracle:
                 ops = after_oracle[col]
-                for g in ops:
-                    if g.gate_type=="H": qc.h(g.row)
-                    elif g.gate_type=="X": qc.x(g.row)
-                    elif g.gate_type=="Y": qc.y(g.row)
-                    elif g.gate_type=="Z": qc.z(g.row)
-                    elif g.gate_type=="RX": qc.rx(g.angle if g.angle is not None else 0, g.row)
-                    elif g.gate_type=="RY": qc.ry(g.angle if g.angle is not None else 0, g.row)
-                    elif g.gate_type=="RZ": qc.rz(g.angle if g.angle is not None else 0, g.row)
-                    elif g.gate_type == "MEASURE":
-                        measured_qubits.add(g.row)
-                        qc.measure(g.row, g.row)
-
-                ctrls = [g.row for g in ops if g.gate_type=="CTRL"]
-                xt = [g.row for g in ops if g.gate_type=="X_T"]
-                zt = [g.row for g in ops if g.gate_type=="Z_T"]
-
-                if len(xt)==1:
-                    t = xt[0]
-                    if len(ctrls)==0: qc.x(t)
-                    elif len(ctrls)==1: qc.cx(ctrls[0], t)
-                    else: qc.mcx(ctrls, t)
-
-                if len(zt)==1:
-                    t = zt[0]
-                    if len(ctrls)==0: qc.z(t)
-                    elif len(ctrls)==1: qc.cz(ctrls[0], t)
-                    else: qc.mcz(ctrls, t)
+                measured_qubits.update(_apply_column(qc, ops, measure=True))
 
             # 측정 게이트가 없으면 경고
             if not measured_qubits:
@@ -2857,7 +3254,7 @@ class TutorialTab(QWidget):
             # 측정된 큐비트 개수만큼만 결과를 자른다
             n_measured = len(measured_qubits)
 
-            sim = AerSimulator()
+            sim = self._simulator()
             shots = 1024
             res = sim.run(qc, shots=shots).result()
             counts = res.get_counts()
@@ -2913,9 +3310,7 @@ class TutorialTab(QWidget):
         self.stack.setCurrentIndex(0)
         self.tutorials_started = False
         if self.current_tutorial:
-            theory_key = self.current_tutorial.theory_key
-            self.intro_title.setText(self.current_tutorial.name)
-            self.intro_text.setText(self.TUTORIAL_DATA.get(theory_key, "이 튜토리얼에 대한 정보가 없습니다."))
+            self.display_tutorial(self.current_tutorial)
 
     def next_step(self):
         if not self.current_tutorial:
@@ -2959,6 +3354,292 @@ class TutorialTab(QWidget):
         self.load_step(self.current_step_index)
 
 
+# 이론 설명 원문은 모든 TutorialTab 인스턴스가 공유하는 읽기 전용 테이블
+# 키는 intern해서 Tutorial.theory_key와 같은 객체로 조회되게 함
+TutorialTab.TUTORIAL_DATA = MappingProxyType({
+    sys.intern(key): text for key, text in TutorialTab.TUTORIAL_DATA.items()
+})
+
+
+# --------------------------------------------------------
+# Tutorial Construction
+# --------------------------------------------------------
+def _build_tutorials() -> List[Tutorial]:
+    """튜토리얼 목록 (내용이 고정이므로 모듈 로드 때 한 번만 만들어 모든 TutorialTab이 공유)"""
+    # -----------------------------
+    # Hadamard Gate Tutorial
+    # -----------------------------
+    hadamard_steps = [
+
+        # 1️⃣ |0⟩ 상태 확인
+        TutorialStep(
+            title="기본 상태 |0⟩",
+            instruction="아무 게이트도 배치하지 말고 회로를 확인하세요.",
+            expected=lambda infos: len(infos) == 0,
+            hint="초기 상태는 |0⟩입니다."
+        ),
+
+        # 2️⃣ 단일 Hadamard
+        TutorialStep(
+            title="중첩 상태 만들기",
+            instruction="q[0]에 Hadamard 게이트를 하나 배치하세요.",
+            expected=lambda infos: (
+                len(infos) == 1 and
+                infos[0].gate_type == 'H' and
+                infos[0].row == 0
+            ),
+            hint="H(q0)는 |0⟩을 중첩 상태로 만듭니다."
+        ),
+
+        # 3️⃣ 가역성
+        TutorialStep(
+            title="Hadamard는 가역적이다",
+            instruction="q[0]에 Hadamard 게이트를 두 번 배치한 후, M(측정) 게이트를 q[0]에 배치하세요.",
+            expected=lambda infos: (
+                sum(1 for g in infos if g.gate_type == 'H' and g.row == 0) == 2 and
+                any(g.gate_type == 'MEASURE' and g.row == 0 for g in infos)
+            ),
+            hint="같은 큐비트에 H를 두 번 연속 배치한 후 M 게이트를 놓으세요."
+        ),
+    ]
+
+    # -----------------------------
+    # CNOT Tutorial
+    # -----------------------------
+    cnot_steps = [
+
+        # 1️⃣ 고전적 준비
+        TutorialStep(
+            title="제어 비트 준비",
+            instruction="q[0]에 X 게이트를 배치하세요.",
+            expected=lambda infos: (
+                len(infos) == 1 and
+                infos[0].gate_type == 'X' and
+                infos[0].row == 0
+            ),
+            hint="제어 큐비트를 |1⟩로 만듭니다."
+        ),
+
+        # 2️⃣ 고전적 상관관계
+        TutorialStep(
+            title="고전적 상관관계",
+            instruction="q[0] → q[1] 방향으로 CNOT을 구성하세요.",
+            expected=_has_gates(("CTRL", 0), ("X_T", 1)),
+            hint="CNOT은 제어가 핵심입니다."
+        ),
+
+        # 3️⃣ Bell 상태 준비
+        TutorialStep(
+            title="Bell 상태 만들기",
+            instruction="X 대신 Hadamard로 Bell 상태를 만드세요.",
+            expected=_has_gates(("H", 0), ("CTRL", 0), ("X_T", 1)),
+            hint="H(q0) → CNOT(q0→q1)"
+        ),
+
+        # 4️⃣ 순서 강제
+        TutorialStep(
+            title="순서가 바뀌면 얽힘이 아니다",
+            instruction="Hadamard가 먼저 와야 합니다.",
+            expected=_has_gates(("H", 0), ("CTRL", 0)),
+            hint="연산은 교환되지 않습니다."
+        ),
+
+        # 5️⃣ 제어/타겟 비대칭성
+        TutorialStep(
+            title="CNOT은 대칭이 아니다",
+            instruction="제어와 타겟을 바꿔보세요.",
+            expected=_has_gates(("CTRL", 1), ("X_T", 0)),
+            hint="얽힘은 방향성을 가집니다."
+        ),
+    ]
+
+    # -----------------------------
+    # QFT Tutorial (Skeleton)
+    # -----------------------------
+    qft_steps = [
+        TutorialStep(
+            title="QFT의 시작",
+            instruction="q[0]에 Hadamard 게이트를 배치하세요.",
+            expected=_has_gates(("H", 0)),
+            hint="QFT는 각 큐비트에 대한 Fourier 변환으로 시작합니다."
+        ),
+
+        TutorialStep(
+            title="제어 위상 연산",
+            instruction="q[0]이 q[1]에 위상을 주도록 제어 게이트를 추가하세요.",
+            expected=_has_gates(("CTRL", 0)),
+            hint="위상 정보는 다른 큐비트와의 관계로 저장됩니다."
+        ),
+
+        TutorialStep(
+            title="두 번째 Hadamard",
+            instruction="q[1]에 Hadamard 게이트를 배치하세요.",
+            expected=_has_gates(("H", 1)),
+            hint="각 큐비트는 자신의 Fourier 변환을 가집니다."
+        ),
+
+        TutorialStep(
+            title="순서의 중요성",
+            instruction="Hadamard → 제어 위상 → Hadamard 순서를 유지하세요.",
+            expected=_has_gates(("H", 0), ("CTRL", None), ("H", 1)),
+            hint="연산 순서가 바뀌면 Fourier 변환이 아닙니다."
+        ),
+
+        TutorialStep(
+            title="출력 비트 순서",
+            instruction="QFT의 출력 순서가 입력과 반대임을 확인하세요.",
+            expected=lambda infos: (
+                len(infos) >= 3  # 아직 SWAP 미구현 → 개념 확인 단계
+            ),
+            hint="QFT 결과는 비트 순서가 뒤집혀 나타납니다."
+        ),
+
+        TutorialStep(
+            title="QFT는 가역적이다",
+            instruction="QFT 뒤에 역연산을 구성하고, 측정(M) 게이트를 q[0]에 배치하세요.",
+            expected=_has_gates(("MEASURE", 0)),
+            hint="모든 양자 게이트는 되돌릴 수 있습니다. 측정 게이트를 추가해주세요."
+        ),
+    ]
+
+    # -----------------------------
+    # Superdense Coding Tutorial
+    # -----------------------------
+    superdense_steps = [
+        TutorialStep(
+            title="Bell Pair 준비",
+            instruction="Alice와 Bob이 공유할 Bell 상태를 준비하세요.",
+            expected=_has_gates(("H", None), ("CTRL", None)),
+            hint="H(q0) → CNOT(q0→q1)"
+        ),
+
+        TutorialStep(
+            title="메시지 선택",
+            instruction=(
+                "앨리스가 보낼 메시지를 선택하세요.\n"
+                "우측 'Choose Message' 버튼을 눌러 00, 01, 10, 11 중 하나를 선택하세요."
+            ),
+            expected=lambda infos: True,
+            hint="'Choose Message' 버튼으로 메시지를 먼저 선택하세요."
+        ),
+
+        TutorialStep(
+            title="Alice의 인코딩",
+            instruction=(
+                "보내고 싶은 메시지에 해당되는 게이트를 앨리스의 큐비트 q[0]에 적용하세요."
+            ),
+            expected=lambda infos: True,
+            hint="Hint를 누르면 적용해야 하는 게이트(I, X, Z, XZ 또는 Y)를 알려드립니다."
+        ),
+
+        TutorialStep(
+            title="Bob의 디코딩 및 검증",
+            instruction=(
+                "Bob의 디코딩 회로를 완성하고 q[0], q[1]에 M(측정) 게이트를 배치하세요.\n"
+                "Check를 누르면 측정 결과가 선택한 메시지와 일치하는지 확인합니다."
+            ),
+            expected=_has_gates(("CTRL", None), ("H", None), ("MEASURE", 0), ("MEASURE", 1)),
+            hint="CNOT 후 Hadamard, 그리고 두 큐비트 모두 측정합니다."
+        )
+
+    ]
+
+    deutsch_jozsa_steps = [
+        TutorialStep(
+            title="초기 상태 |0⟩|0⟩|1⟩ 만들기",
+            instruction=(
+                "Deutsch–Jozsa 알고리즘은 |0⟩|0⟩|1⟩ 상태에서 시작합니다.\n"
+                "출력 큐비트 q[2]에 X 게이트를 배치하세요."
+            ),
+            expected=_has_gates(("X", 2)),
+            hint="q[2]에 X 게이트를 놓으세요."
+        ),
+
+        TutorialStep(
+            title="모든 큐비트에 Hadamard 적용",
+            instruction=(
+                "모든 큐비트에 Hadamard 게이트를 적용합니다.\n"
+                "q[0], q[1], q[2]에 각각 Hadamard 게이트를 배치하세요.\n"
+                "(출력 큐비트 q[2]의 H는 위상 킥백에 필수입니다)"
+            ),
+            expected=_has_gates(("X", 2), ("H", 0), ("H", 1), ("H", 2)),
+            hint="q[0], q[1], q[2] 세 큐비트 모두에 H 게이트를 놓으세요."
+        ),
+
+        TutorialStep(
+            title="Oracle 정의하기",
+            instruction=(
+                "숨겨진 함수 f(x)를 정의합니다.\n\n"
+                "• constant / balanced 중 선택\n"
+                "• constant: 출력이 항상 0 또는 1\n"
+                "• balanced: 00,01,10,11 중 두 개만 1\n\n"
+                "Define Oracle 버튼을 눌러 정의하세요."
+            ),
+            expected=lambda infos: True,  # check_step에서 특별 처리
+            hint="Define Oracle 버튼을 눌러 constant 또는 balanced를 선택하세요.",
+            #auto_setup=lambda view: self.open_oracle_dialog()
+        ),
+        TutorialStep(
+            title="오라클 뒤 입력 큐비트에 Hadamard 적용",
+            instruction=(
+                "Oracle을 적용한 뒤 입력 큐비트 q[0], q[1]에 Hadamard 게이트를 배치하세요."
+            ),
+            expected=lambda infos: (
+                sum(1 for g in infos if g.gate_type == "H" and g.row == 0) >= 2 and
+                sum(1 for g in infos if g.gate_type == "H" and g.row == 1) >= 2
+            ),
+            hint="q[0]과 q[1] 두 입력 큐비트에 H를 한 번 더 적용합니다."
+        ),
+        TutorialStep(
+            title="입력 큐비트 측정 및 판별",
+            instruction=(
+                "모든 입력 큐비트 q[0], q[1]에 측정(M) 게이트를 배치하세요.\n\n"
+                "예상 결과:\n"
+                "• constant → 측정 결과가 모두 |00⟩\n"
+                "• balanced → 측정 결과에 |00⟩이 없음 (|01⟩, |10⟩, |11⟩ 중 하나)\n\n"
+                "M 게이트 배치 후 Check를 눌러 판별합니다."
+            ),
+            expected=_has_gates(("MEASURE", 0), ("MEASURE", 1)),
+            hint="q[0]과 q[1] 두 입력 큐비트에 M(측정) 게이트를 놓으세요."
+        ),
+
+
+
+
+    ]
+
+    return [
+        Tutorial(
+            name="Hadamard Gate",
+            theory_key="1. Qubit과 Hadamard Gate",
+            steps=hadamard_steps
+        ),
+        Tutorial(
+            name="CNOT Gate",
+            theory_key="2. CNOT과 Entanglement",
+            steps=cnot_steps
+        ),
+        Tutorial(
+            name="Quantum Fourier Transform",
+            theory_key="3. 양자 푸리에 변환 (QFT) 기초",
+            steps=qft_steps
+        ),
+        Tutorial(
+            name="Superdense Coding",
+            theory_key="4. 초고밀도 코딩 (Superdense Coding)",
+            steps=superdense_steps
+        ),
+        Tutorial(
+            name="Deutsch Jozsa Algorithm",
+            theory_key="5. Deutsch Jozsa Algorithm",
+            steps=deutsch_jozsa_steps
+        )
+    ]
+
+
+_TUTORIALS: Tuple[Tutorial, ...] = tuple(_build_tutorials())
+
+
 def load_step(self, index: int):
     if index >= len(self.current_tutorial.steps):
         QMessageBox.warning(self, "Error", "Invalid tutorial step index")